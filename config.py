@@ -2,22 +2,74 @@
 Configurações globais do Sistema de Monitoramento de Quedas Hospitalares.
 """
 
+import os
+import platform
+
+# Threads de OpenMP/BLAS e OpenCL do OpenCV: precisam valer antes do primeiro
+# import de numpy/cv2/torch (main.py importa este módulo antes deles).
+# 2 threads deixam núcleos livres para o backend de inferência no Pi (4 núcleos).
+os.environ.setdefault("OMP_NUM_THREADS", "2")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "2")
+os.environ.setdefault("MKL_NUM_THREADS", "2")
+os.environ.setdefault("OPENCV_OPENCL_RUNTIME", "disabled")
+
+# Plataforma ARM (Raspberry Pi 4/5): usa modelos exportados para NCNN
+IS_ARM = platform.machine().lower() in ("aarch64", "arm64")
+
 # Intervalo para re-verificação da cama (em horas)
+# Ignorado enquanto BED_FREEZE_AFTER_CALIBRATION = True
 BED_RECHECK_INTERVAL_HOURS = 6
 
+# Congela a referência da cama após a primeira detecção bem-sucedida
+# (desliga o re-check periódico; recalibração só reiniciando o serviço)
+# Ligado por padrão: BED_RECHECK_INTERVAL_HOURS deixa de valer e o re-check do
+# loop principal não roda; instalações que dependem da re-detecção a cada
+# BED_RECHECK_INTERVAL_HOURS devem definir False
+BED_FREEZE_AFTER_CALIBRATION = True
+
 # Intervalo de retry quando cama não é localizada (em segundos)
 BED_STANDBY_RETRY_SECONDS = 2
 
 # Tamanho da janela deslizante para buffer de features (em frames)
 FEATURE_BUFFER_SIZE = 15
 
+# Layout SoA do buffer de features: array (FEATURE_BUFFER_SIZE, len(FEATURE_COLUMNS))
+# preenchido como ring buffer; agregações viram operações vetorizadas por coluna.
+# float64 (e não float32) para preservar precisão do timestamp (epoch) no cálculo
+# de duração: float32 só resolve ~2 min em valores da ordem de 1.7e9.
+# Nome do dtype (str): o NumPy só é importado em modules/patient_monitor.py.
+FEATURE_COLUMNS = ("timestamp", "x1", "y1", "x2", "y2")
+FEATURE_BUFFER_DTYPE = "float64"
+
+# Modelos exportados para NCNN (kernels NEON, ~2-3x mais rápido que PyTorch no Pi)
+# Gerados pelo deploy/install.sh: yolo export model=yolov8n-pose.pt format=ncnn
+# Fora do ARM, ou se a exportação não existir, usa os pesos .pt (PyTorch)
+YOLO_POSE_MODEL_NCNN = "models/yolov8n-pose_ncnn_model"
+
 # Modelo YOLOv8 a utilizar (yolov8n.pt para melhor performance)
 YOLO_MODEL = "yolov8n.pt"
 
 # Modelo YOLOv8-Pose para detecção de keypoints
-YOLO_POSE_MODEL = "yolov8n-pose.pt"
+YOLO_POSE_MODEL = (
+    YOLO_POSE_MODEL_NCNN if IS_ARM and os.path.isdir(YOLO_POSE_MODEL_NCNN) else "yolov8n-pose.pt"
+)
 YOLO_POSE_CONFIDENCE = 0.20        # Confiança mínima para detecção de pessoas (default YOLO: 0.25)
 
+# Precisão do modelo de pose: "fp32" | "fp16" | "int8" (override via env MVISION_PRECISION)
+# int8: TFLite quantizado (~2x throughput em CPU ARM); fp16: .pt com half=True (só GPU)
+# Exportar com: yolo export model=yolov8n-pose.pt format=tflite int8=True imgsz=320 data=calib.yaml
+# Se o arquivo INT8 não existir, usa YOLO_POSE_MODEL
+# O modelo da cama (YOLO_BED_MODEL) roda sempre no formato em que foi salvo
+MODEL_PRECISIONS = ("fp32", "fp16", "int8")
+MODEL_PRECISION = os.getenv("MVISION_PRECISION", "int8").lower()
+YOLO_POSE_MODEL_INT8 = "models/yolov8n-pose_int8.tflite"
+
+# Resolução de entrada dos modelos (múltiplo de 32; default do YOLO = 640)
+# Custo do backbone cresce ~quadraticamente com o lado: 320 = ~4x menos MACs que 640
+# Exportações NCNN/TFLite devem usar o mesmo imgsz (grafo estático)
+MODEL_IMGSZ = 320
+POSE_MODEL_IMGSZ = 320
+
 # Thresholds de confiança para keypoints
 POSE_CONFIDENCE_HIGH = 0.7        # Confiança alta (ponto confiável)
 POSE_CONFIDENCE_MIN = 0.3         # Confiança mínima (ignorar abaixo disso)
@@ -28,6 +80,7 @@ POSE_FRAMES_PATIENT_DETECTED = 15 # Frames para confirmar paciente na cama
 
 # Configurações EMA (Média Móvel Exponencial) para detecção de estados
 EMA_ALPHA = 0.3                   # Fator de suavização (0.1=lento, 0.5=rápido)
+# Atualização na forma s += alpha * (x - s) sobre o vetor de scores (uma mul + uma soma)
 EMA_THRESHOLD_ENTER_RISK = 0.5    # Score para entrar em RISCO_POTENCIAL
 EMA_THRESHOLD_EXIT_RISK = 0.3     # Score para sair de RISCO_POTENCIAL
 EMA_THRESHOLD_ENTER_OUT = 0.55    # Score para entrar em PACIENTE_FORA (acima de ENTER_RISK)
@@ -68,20 +121,66 @@ KP_RIGHT_KNEE = 14
 KP_LEFT_ANKLE = 15
 KP_RIGHT_ANKLE = 16
 
+# Índices acima empacotados para gather único (keypoints[KP_TORSO_LEGS_IDX] -> (8, 2))
+# Ordem: ombros E/D, quadris E/D, joelhos E/D, tornozelos E/D
+KP_TORSO_LEGS_IDX = (
+    KP_LEFT_SHOULDER, KP_RIGHT_SHOULDER,
+    KP_LEFT_HIP, KP_RIGHT_HIP,
+    KP_LEFT_KNEE, KP_RIGHT_KNEE,
+    KP_LEFT_ANKLE, KP_RIGHT_ANKLE,
+)
+
+# Threads do pool interno do OpenCV (cvtColor, resize, etc.)
+CV2_NUM_THREADS = 2
+
 # Índice da câmera (0 = câmera padrão)
 CAMERA_INDEX = 0
 
 # Backend OpenCV no Windows ("DSHOW" = DirectShow, mais estavel; "MSMF" = padrao; None = auto)
 CAMERA_BACKEND = "DSHOW"
 
+# Resolução de captura (no Picamera2 o redimensionamento é feito pelo ISP, sem cv2.resize)
+CAPTURE_WIDTH = 640
+CAPTURE_HEIGHT = 480
+# Formato do stream Picamera2: "RGB888" ou "YUV420" (1.5 bytes/px, metade da banda do RGB888)
+# Atenção à ordem de canais: o RGB888 do Picamera2 já é BGR na memória e o
+# caminho RGB888 (COLOR_RGB2BGR, como no código original) entrega R e B trocados
+# aos modelos; o YUV420 entrega BGR correto. Trocar para "YUV420" muda as cores
+# vistas pelos modelos: validar a detecção da cama antes de mudar o padrão.
+CAPTURE_PIXEL_FORMAT = "RGB888"
+
 # Classes YOLO COCO para detecção
 YOLO_CLASS_PERSON = 0
 
+# Argumentos comuns de model.predict (centralizados para nenhuma chamada esquecê-los)
+# verbose=False evita log por frame no tty; stream=True devolve gerador e libera
+# os Results entre frames
+PREDICT_KWARGS = dict(
+    verbose=False,
+    stream=True,
+    imgsz=MODEL_IMGSZ,
+    half=MODEL_PRECISION == "fp16",
+)
+# Pose: só pessoas (NMS de uma classe) e poucas detecções por frame
+PREDICT_KWARGS_POSE = {
+    **PREDICT_KWARGS,
+    "imgsz": POSE_MODEL_IMGSZ,
+    "conf": YOLO_POSE_CONFIDENCE,
+    "iou": 0.45,
+    "classes": [YOLO_CLASS_PERSON],
+    "max_det": 5,
+}
+# Cama: classes e conf vêm de cada estratégia (resolvidas por nome no modelo)
+PREDICT_KWARGS_BED = {**PREDICT_KWARGS, "max_det": 10}
+
 # Nomes das classes COCO para detectar cama (resolução dinâmica por nome)
 BED_CLASS_NAMES = ["bed"]
 
 # Modelo dedicado para detecção de cama (só roda na calibração, não impacta loop principal)
 YOLO_BED_MODEL = "yolov8l.pt"
+# Inferência descartável no BedDetector.__init__: monta o predictor e aquece o
+# modelo na inicialização, em vez de atrasar o primeiro frame da calibração
+BED_MODEL_WARMUP = True
 
 # Modelo ASETO fine-tuned para detecção de cama hospitalar (câmeras IR)
 # Roda no frame CRU (antes da normalização IR) — confiança maior sem pré-processamento
@@ -125,6 +224,7 @@ CALIBRATION_FRAMES = 10              # Quadros para calibração
 CALIBRATION_MAX_VARIANCE = 35        # Variação máxima em pixels para considerar estável
 CALIBRATION_SUCCESS_DISPLAY_SECONDS = 3  # Tempo para mostrar "Configuração concluída"
 CALIBRATION_MIN_DETECTION_RATE = 0.5  # Maioria dos frames (5/10) deve conter a cama
+CALIBRATION_BUFFER_DTYPE = "float32"  # Buffer pré-alocado (CALIBRATION_FRAMES, 4) com (x1, y1, x2, y2)
 
 # Fallback por consistencia espacial
 # Quando calibracao padrao falha (poucas deteccoes), aceita cluster menor
@@ -134,10 +234,23 @@ CALIBRATION_CONSISTENCY_VARIANCE = 30    # Max variancia (px) para aceitar clust
 CALIBRATION_CONSISTENCY_MAX_DIST = 80    # Max distancia entre bboxes no mesmo cluster (px)
 
 # Controle de FPS
-FRAME_DELAY_SECONDS = 0.2            # Sleep entre frames (5 FPS)
+TARGET_FPS = 5                       # Cadencia alvo do loop principal
+FRAME_BUDGET_SECONDS = 1.0 / TARGET_FPS  # Orcamento por frame (sleep so do que sobrar)
+OVERRUN_WARN_THRESHOLD = 0.05        # Estouro do orcamento (s) que gera aviso no log
 
-# Caminho para persistência de referência da cama
-BED_REFERENCE_PATH = "data/bed_reference.json"
+# Cadencia de inferencia (desacopla FPS de captura do FPS de deteccao)
+POSE_EVERY_N_FRAMES = 1              # YOLO-Pose a cada N frames (reusa ultimo resultado nos demais)
+BED_DETECT_EVERY_N_FRAMES = 150      # Avalia re-check da cama a cada N frames
+
+# Pipeline de pose: captura + YOLO-Pose numa thread, analise/desenho/exibicao na principal
+# (as duas etapas rodam em paralelo; False = tudo sequencial na thread principal)
+POSE_ASYNC_PIPELINE = True
+POSE_PIPELINE_TIMEOUT = 5.0          # Espera maxima por um frame processado (s)
+
+# Caminho para persistência de referência da cama (binário NumPy, leitura sem parse)
+BED_REFERENCE_PATH = "data/bed_reference.npz"
+# Cópia legível da referência (apenas exportação; também lida como legado)
+BED_REFERENCE_PATH_JSON = "data/bed_reference.json"
 
 # Diretório para logs de eventos
 LOGS_DIR = "data/logs"
@@ -145,24 +258,45 @@ LOGS_DIR = "data/logs"
 # Configurações de visualização
 WINDOW_NAME = "Monitor de Quedas Hospitalares"
 DASHBOARD_WIDTH = 200  # Largura do painel lateral em pixels
+# Re-renderiza as métricas do dashboard a cada N frames (1 = todo frame)
+# Mudança de estado sempre força o redesenho imediato
+DASHBOARD_RENDER_EVERY_N_FRAMES = 1
+# Modo headless: sem janela nem desenho do dashboard por frame (MVISION_HEADLESS=1)
+# Mesmo assim as anotações são desenhadas nos frames salvos como evidência de alerta
+HEADLESS = os.getenv("MVISION_HEADLESS", "0") == "1"
+RENDER_DASHBOARD = not HEADLESS
 FLIP_HORIZONTAL = True  # Inverter imagem horizontalmente (espelho)
+# Picamera2: espelha no sensor via libcamera Transform (sem cópia do frame)
+# OpenCV/USB: sem controle equivalente, usa cv2.flip na leitura
+FLIP_VIA_SENSOR = True
 
 # Modo de desenvolvimento/homologação
 DEV_MODE = True  # Quando True, salva imagens de alertas para evidência
 
 # Modo de desenvolvimento: ignora detecção de cama
-# Quando True, usa a última referência salva em bed_reference.json
+# Quando True, usa a última referência salva em bed_reference.npz
 # Útil para testes em ambientes sem cama/sofá disponível
 DEV_SKIP_BED_DETECTION = True
 
 # Diretório para imagens de alertas (modo dev/homologação)
 ALERT_IMAGES_DIR = "data/alert_images"
 MAX_ALERT_IMAGES = 50  # Máximo de imagens retidas no diretório
+ALERT_JPEG_QUALITY = 85  # Qualidade JPEG das imagens de alerta (encode mais rápido, arquivo menor)
+# Encode + escrita das imagens de alerta em thread separada (o loop só copia o frame)
+ALERT_IMAGE_ASYNC_WRITE = True
+ALERT_IMAGE_QUEUE_SIZE = 8  # Imagens pendentes antes de descartar
 
 # Arquivo de log de alertas (rotacionado por tempo)
 ALERT_LOG_PATH = "data/logs/alerts.log"
 ALERT_LOG_RETENTION_DAYS = 5  # Manter logs por 5 dias
 
+# Nivel de log (console e log de alertas)
+LOG_LEVEL = "INFO"
+# Escrita do log em thread separada (QueueHandler + QueueListener): o loop principal
+# apenas enfileira; write/rotacao no cartao SD pode levar 10+ ms
+LOG_USE_QUEUE_HANDLER = True
+LOG_ASYNC_QUEUE_SIZE = 1000  # Registros pendentes antes de descartar
+
 # Identificação do ambiente (para deploy em múltiplos Raspberry Pi)
 ENVIRONMENT_CONFIG_PATH = "config/environment.json"
 ENVIRONMENT_DEFAULT_ID = "NAO-CONFIGURADO"
@@ -177,6 +311,10 @@ GPIO_REAL_MODE = None
 # O serviço systemd pode iniciar antes do desktop estar pronto
 # O sistema continua mesmo sem monitor físico conectado
 DISPLAY_WAIT_TIMEOUT = 120
+# Intervalo entre consultas ao X11 durante a espera (segundos)
+DISPLAY_POLL_INTERVAL = 0.5
+# Pula a espera na hora se não houver DISPLAY definido ou xset instalado
+DISPLAY_SKIP_WHEN_HEADLESS = True
 
 # =============================================================================
 # GPIO Configuration (Raspberry Pi only)
@@ -184,4 +322,9 @@ DISPLAY_WAIT_TIMEOUT = 120
 GPIO_PIN_ALERT = 16          # Pino para alerta de risco (pisca)
 GPIO_PIN_SYSTEM_READY = 20   # Pino para sistema configurado
 GPIO_BLINK_INTERVAL = 0.5    # Intervalo de pisca em segundos
-GPIO_ALERT_DURATION = 30     # Duracao maxima do alerta em segundos
+GPIO_ALERT_DURATION = 30     # Duracao maxima do alerta em segundos (prazo em time.monotonic())
+# Pisca via PWM de hardware (sem thread acordando a cada GPIO_BLINK_INTERVAL)
+# Requer dtoverlay=pwm no config.txt e o LED ligado no pino do canal:
+# canal 0 = GPIO18 (pino 12), canal 1 = GPIO19 (pino 35). Desligado mantém GPIO_PIN_ALERT.
+GPIO_ALERT_USE_HW_PWM = False
+GPIO_ALERT_PWM_CHANNEL = 0
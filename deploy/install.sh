@@ -49,7 +49,7 @@ if [ ! -f "$PROJECT_DIR/main.py" ]; then
 fi
 
 # 1. Configura o arquivo de serviço com o caminho correto
-echo "[1/4] Configurando serviço systemd..."
+echo "[1/5] Configurando serviço systemd..."
 cat > /etc/systemd/system/hospital-monitor.service << EOF
 [Unit]
 Description=Sistema de Monitoramento de Quedas Hospitalares
@@ -85,13 +85,30 @@ EOF
 echo "  Serviço configurado para: $PROJECT_DIR"
 
 # 2. Recarrega e habilita o serviço
-echo "[2/4] Habilitando serviço..."
+echo "[2/5] Habilitando serviço..."
 systemctl daemon-reload
 systemctl enable hospital-monitor
 echo "  Serviço habilitado para iniciar no boot"
 
-# 3. Configura permissões
-echo "[3/4] Configurando permissões..."
+# 3. Exporta modelos para NCNN (inferência com kernels NEON no ARM)
+# config.py usa models/yolov8n-pose_ncnn_model automaticamente quando existir
+echo "[3/5] Exportando modelo de pose para NCNN..."
+mkdir -p "$PROJECT_DIR/models"
+for MODEL in yolov8n-pose; do
+    if [ -d "$PROJECT_DIR/models/${MODEL}_ncnn_model" ]; then
+        echo "  ✓ ${MODEL}_ncnn_model já exportado"
+        continue
+    fi
+    if (cd "$PROJECT_DIR" && python3 -c "from config import MODEL_IMGSZ; from ultralytics import YOLO; YOLO('${MODEL}.pt').export(format='ncnn', imgsz=MODEL_IMGSZ)"); then
+        mv "$PROJECT_DIR/${MODEL}_ncnn_model" "$PROJECT_DIR/models/"
+        echo "  ✓ ${MODEL}_ncnn_model exportado"
+    else
+        echo "  ! Falha ao exportar ${MODEL} - será usado ${MODEL}.pt (PyTorch)"
+    fi
+done
+
+# 4. Configura permissões
+echo "[4/5] Configurando permissões..."
 chown -R $SERVICE_USER:$SERVICE_GROUP "$PROJECT_DIR"
 chmod +x "$PROJECT_DIR/main.py"
 
@@ -100,9 +117,9 @@ usermod -aG gpio $SERVICE_USER 2>/dev/null || true
 usermod -aG video $SERVICE_USER 2>/dev/null || true
 echo "  Usuário $SERVICE_USER adicionado aos grupos gpio e video"
 
-# 4. Verifica arquivos importantes
-echo "[4/4] Verificando configuração..."
-if [ -f "$PROJECT_DIR/data/bed_reference.json" ]; then
+# 5. Verifica arquivos importantes
+echo "[5/5] Verificando configuração..."
+if [ -f "$PROJECT_DIR/data/bed_reference.npz" ] || [ -f "$PROJECT_DIR/data/bed_reference.json" ]; then
     echo "  ✓ Referência de cama encontrada"
 else
     echo "  ! Referência de cama NÃO encontrada (será calibrada no primeiro uso)"
@@ -7,18 +7,67 @@ Suporta multiplataforma:
 - Linux/Raspberry Pi: Modo headless
 """
 
-from typing import Dict, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Dict, Iterator, Optional, Tuple
 
 import cv2
 import numpy as np
 
-from config import DASHBOARD_WIDTH, WINDOW_NAME, POSE_CONFIDENCE_HIGH
+from config import (
+    DASHBOARD_RENDER_EVERY_N_FRAMES,
+    DASHBOARD_WIDTH,
+    POSE_CONFIDENCE_HIGH,
+    RENDER_DASHBOARD,
+    WINDOW_NAME,
+)
 from modules.state_machine import PatientState, PatientPoseState, StateMachine
 from modules.camera import DisplayBase, DisplayOpenCV, create_display, IS_WINDOWS, IS_LINUX
 
 
+@lru_cache(maxsize=256)
+def _text_size(text: str, font: int, scale: float, thickness: int) -> Tuple[Tuple[int, int], int]:
+    """cv2.getTextSize memoizado (rótulos se repetem quadro a quadro)."""
+    return cv2.getTextSize(text, font, scale, thickness)
+
+
+def _int_bbox(bbox) -> Tuple[int, int, int, int]:
+    """
+    Converte bbox para inteiros (truncando, como int()).
+
+    ndarray inteiro sai direto por tolist(); ndarray float é convertido em
+    uma única chamada; tuplas/listas são desempacotadas sem list-comp.
+    """
+    if isinstance(bbox, np.ndarray):
+        if bbox.dtype.kind not in "iu":
+            bbox = bbox.astype(np.int64)
+        return tuple(bbox.tolist())
+    x1, y1, x2, y2 = bbox
+    return int(x1), int(y1), int(x2), int(y2)
+
+
+def _skip_if_headless(method):
+    """
+    Faz um draw_* devolver o frame intacto quando não há o que renderizar.
+
+    Respeita skip_rendering (que pode ser alternado em runtime) e o
+    modo forçado de force_rendering().
+    """
+    @wraps(method)
+    def wrapper(self, frame, *args, **kwargs):
+        if self.skip_rendering and not self._force_rendering:
+            return frame
+        return method(self, frame, *args, **kwargs)
+    return wrapper
+
+
 class DisplayManager:
-    """Gerenciador de interface visual com OpenCV."""
+    """
+    Gerenciador de interface visual com OpenCV.
+
+    Os métodos draw_* desenham no próprio frame recebido (sem cópia) e o
+    retornam; os que anexam o dashboard retornam o buffer de saída reaproveitado.
+    """
 
     # Cores padrão (BGR)
     COLOR_BED = (255, 150, 0)  # Azul claro
@@ -32,13 +81,37 @@ class DisplayManager:
     FONT_SCALE_MEDIUM = 0.6
     FONT_SCALE_LARGE = 0.8
 
+    # Estilo (cor BGR, raio) dos keypoints, indexado por confianca/posicao
+    KEYPOINT_STYLES = (
+        ((128, 128, 128), 5),  # Cinza: baixa confianca
+        ((0, 165, 255), 8),    # Laranja: fora da cama
+        ((0, 255, 0), 8),      # Verde: dentro da cama
+    )
+
+    # Cor BGR por estado (sistema legado baseado em bbox)
+    STATE_COLORS = {
+        PatientState.VAZIO: (128, 128, 128),
+        PatientState.REPOUSO: (0, 255, 0),
+        PatientState.ALERTA: (0, 255, 255),
+        PatientState.CRITICO: (0, 0, 255),
+    }
+
+    # Mensagens exibidas por draw_pose_state_message
+    POSE_STATE_MESSAGES = {
+        PatientPoseState.AGUARDANDO: "Aguardando paciente...",
+        PatientPoseState.MONITORANDO: "Paciente em monitoramento",
+        PatientPoseState.RISCO_POTENCIAL: "ATENCAO: Risco de queda",
+        PatientPoseState.PACIENTE_FORA: "ALERTA: Paciente fora da cama!",
+        PatientPoseState.ACOMPANHADO: "Paciente acompanhado",
+    }
+
     def __init__(self, window_name: Optional[str] = None, headless: bool = False):
         """
         Inicializa o gerenciador de display.
 
         Args:
             window_name: Nome da janela. Default: config.WINDOW_NAME
-            headless: Se True, força modo headless (sem GUI) - não recomendado
+            headless: Se True, força modo headless (sem GUI)
         """
         self.window_name = window_name or WINDOW_NAME
         self.dashboard_width = DASHBOARD_WIDTH
@@ -48,9 +121,38 @@ class DisplayManager:
         self._display: DisplayBase = create_display(headless=headless)
         self.headless = not isinstance(self._display, DisplayOpenCV)
 
-        # Sempre renderiza no modo normal (GUI)
-        self.skip_rendering = False
+        # Sem janela (headless forçado ou X11 indisponível) não há para quem desenhar
+        self.skip_rendering = self.headless or not RENDER_DASHBOARD
+        self._force_rendering = False
+
+        # Fundos estáticos dos dashboards (título, separadores, controles) por altura
+        self._dashboard_template_cache: Dict[int, np.ndarray] = {}
+        self._pose_dashboard_template_cache: Dict[int, np.ndarray] = {}
+
+        # Último painel renderizado e a chave (textos visíveis) que o gerou
+        self._dashboard_cache: Optional[Tuple[tuple, np.ndarray]] = None
+        self._pose_dashboard_cache: Optional[Tuple[tuple, np.ndarray]] = None
+        self._dashboard_interval = max(1, DASHBOARD_RENDER_EVERY_N_FRAMES)
+        self._dashboard_frame_count = 0
+
+        # Cores por estado (enums pequenos; evita chamada de função por frame)
+        self._pose_color: Dict[PatientPoseState, Tuple[int, int, int]] = {
+            state: StateMachine.get_pose_state_color(state) for state in PatientPoseState
+        }
+        self._state_color: Dict[PatientState, Tuple[int, int, int]] = {
+            state: self._get_state_color_bgr(state) for state in PatientState
+        }
+
+        # Tamanho (w, h) das mensagens de estado de pose, medido uma vez
+        self._pose_msg_sizes: Dict[PatientPoseState, Tuple[int, int]] = {
+            state: _text_size(message, self.FONT, self.FONT_SCALE_LARGE, 2)[0]
+            for state, message in self.POSE_STATE_MESSAGES.items()
+        }
+
+        # Buffer de saída (vídeo + dashboard) reaproveitado entre frames
+        self._composite_buf: Optional[np.ndarray] = None
 
+    @_skip_if_headless
     def draw_bed_polygon(
         self,
         frame: np.ndarray,
@@ -69,14 +171,14 @@ class DisplayManager:
             Frame com cama desenhada.
         """
         color = color or self.COLOR_BED
-        x1, y1, x2, y2 = [int(v) for v in bbox]
+        x1, y1, x2, y2 = _int_bbox(bbox)
 
         # Desenha retângulo com bordas arredondadas (simulado)
         cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
 
         # Label "CAMA"
         label = "CAMA"
-        (w, h), _ = cv2.getTextSize(label, self.FONT, self.FONT_SCALE_SMALL, 1)
+        (w, h), _ = _text_size(label, self.FONT, self.FONT_SCALE_SMALL, 1)
         cv2.rectangle(frame, (x1, y1 - h - 10), (x1 + w + 10, y1), color, -1)
         cv2.putText(
             frame,
@@ -90,6 +192,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_patient_bbox(
         self,
         frame: np.ndarray,
@@ -109,13 +212,13 @@ class DisplayManager:
         Returns:
             Frame com paciente desenhado.
         """
-        x1, y1, x2, y2 = [int(v) for v in bbox]
+        x1, y1, x2, y2 = _int_bbox(bbox)
 
         # Desenha retângulo
         cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
 
         # Label
-        (w, h), _ = cv2.getTextSize(label, self.FONT, self.FONT_SCALE_SMALL, 1)
+        (w, h), _ = _text_size(label, self.FONT, self.FONT_SCALE_SMALL, 1)
         cv2.rectangle(frame, (x1, y1 - h - 10), (x1 + w + 10, y1), color, -1)
         cv2.putText(
             frame,
@@ -129,6 +232,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_dashboard(
         self,
         frame: np.ndarray,
@@ -150,46 +254,12 @@ class DisplayManager:
         """
         h, w = frame.shape[:2]
 
-        # Cria painel lateral
-        dashboard = np.full((h, self.dashboard_width, 3), self.COLOR_DASHBOARD_BG, dtype=np.uint8)
-
-        # Título
-        cv2.putText(
-            dashboard,
-            "DASHBOARD",
-            (10, 30),
-            self.FONT,
-            self.FONT_SCALE_MEDIUM,
-            self.COLOR_TEXT,
-            1,
-        )
-        cv2.line(dashboard, (10, 40), (self.dashboard_width - 10, 40), self.COLOR_TEXT, 1)
-
-        # Estado atual
-        state_color = self._get_state_color_bgr(state)
-        cv2.putText(
-            dashboard,
-            f"Estado: {state.value}",
-            (10, 70),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            state_color,
-            1,
-        )
-
-        # Contagem de pessoas
-        cv2.putText(
-            dashboard,
-            f"Pessoas: {persons_count}",
-            (10, 100),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            self.COLOR_TEXT,
-            1,
-        )
-
-        # Separador
-        cv2.line(dashboard, (10, 115), (self.dashboard_width - 10, 115), self.COLOR_TEXT, 1)
+        # Textos dinâmicos: (texto, posição, escala, cor)
+        state_color = self._state_color[state]
+        texts = [
+            (f"Estado: {state.value}", (10, 70), self.FONT_SCALE_SMALL, state_color),
+            (f"Pessoas: {persons_count}", (10, 100), self.FONT_SCALE_SMALL, self.COLOR_TEXT),
+        ]
 
         # Features (se disponíveis)
         y_pos = 140
@@ -205,26 +275,52 @@ class DisplayManager:
 
             for name, value in metrics:
                 text = f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}"
-                cv2.putText(
-                    dashboard,
-                    text,
-                    (10, y_pos),
-                    self.FONT,
-                    self.FONT_SCALE_SMALL,
-                    self.COLOR_TEXT,
-                    1,
-                )
+                texts.append((text, (10, y_pos), self.FONT_SCALE_SMALL, self.COLOR_TEXT))
                 y_pos += 25
         else:
-            cv2.putText(
-                dashboard,
-                "Sem dados",
-                (10, y_pos),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                (128, 128, 128),
-                1,
-            )
+            texts.append(("Sem dados", (10, y_pos), self.FONT_SCALE_SMALL, (128, 128, 128)))
+
+        # Só re-renderiza o painel quando algo visível mudou
+        key = (h, state, tuple(texts))
+        if not self._can_reuse_panel(self._dashboard_cache, key):
+            # Painel lateral a partir do fundo estático pré-renderizado
+            template = self._dashboard_template_cache.get(h)
+            if template is None:
+                template = self._dashboard_template_cache[h] = self._build_dashboard_template(h)
+            dashboard = self._reset_panel(self._dashboard_cache, template)
+            self._put_texts(dashboard, texts)
+            self._dashboard_cache = (key, dashboard)
+        dashboard = self._dashboard_cache[1]
+
+        # Concatena dashboard ao frame
+        return self._compose(frame, dashboard)
+
+    def _build_dashboard_template(self, h: int) -> np.ndarray:
+        """
+        Renderiza as partes estáticas do dashboard de métricas.
+
+        Args:
+            h: Altura do frame (o painel acompanha a altura do vídeo).
+
+        Returns:
+            Painel com título, separadores e legenda de controles.
+        """
+        dashboard = np.full((h, self.dashboard_width, 3), self.COLOR_DASHBOARD_BG, dtype=np.uint8)
+
+        # Título
+        cv2.putText(
+            dashboard,
+            "DASHBOARD",
+            (10, 30),
+            self.FONT,
+            self.FONT_SCALE_MEDIUM,
+            self.COLOR_TEXT,
+            1,
+        )
+        cv2.line(dashboard, (10, 40), (self.dashboard_width - 10, 40), self.COLOR_TEXT, 1)
+
+        # Separador
+        cv2.line(dashboard, (10, 115), (self.dashboard_width - 10, 115), self.COLOR_TEXT, 1)
 
         # Controles no final
         y_pos = h - 100
@@ -251,9 +347,9 @@ class DisplayManager:
                 1,
             )
 
-        # Concatena dashboard ao frame
-        return np.hstack([frame, dashboard])
+        return dashboard
 
+    @_skip_if_headless
     def draw_status(
         self,
         frame: np.ndarray,
@@ -290,6 +386,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_standby(self, frame: np.ndarray) -> np.ndarray:
         """
         Desenha tela de stand-by quando cama não é detectada.
@@ -303,15 +400,13 @@ class DisplayManager:
         h, w = frame.shape[:2]
 
         # Overlay escuro
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
+        frame = self._darken(frame, 0.3)
 
         # Mensagem central
         text = "STAND-BY"
         subtext = "Cama nao localizada - Aguardando..."
 
-        (tw, th), _ = cv2.getTextSize(text, self.FONT, 1.5, 2)
+        (tw, th), _ = _text_size(text, self.FONT, 1.5, 2)
         cv2.putText(
             frame,
             text,
@@ -322,7 +417,7 @@ class DisplayManager:
             2,
         )
 
-        (stw, sth), _ = cv2.getTextSize(subtext, self.FONT, self.FONT_SCALE_MEDIUM, 1)
+        (stw, sth), _ = _text_size(subtext, self.FONT, self.FONT_SCALE_MEDIUM, 1)
         cv2.putText(
             frame,
             subtext,
@@ -335,6 +430,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_system_message(
         self,
         frame: np.ndarray,
@@ -357,12 +453,10 @@ class DisplayManager:
         h, w = frame.shape[:2]
 
         # Overlay escuro
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
+        frame = self._darken(frame, 0.3)
 
         # Título
-        (tw, th), _ = cv2.getTextSize(title, self.FONT, 1.2, 2)
+        (tw, th), _ = _text_size(title, self.FONT, 1.2, 2)
         cv2.putText(
             frame,
             title,
@@ -374,7 +468,7 @@ class DisplayManager:
         )
 
         # Subtítulo
-        (stw, sth), _ = cv2.getTextSize(subtitle, self.FONT, self.FONT_SCALE_MEDIUM, 1)
+        (stw, sth), _ = _text_size(subtitle, self.FONT, self.FONT_SCALE_MEDIUM, 1)
         cv2.putText(
             frame,
             subtitle,
@@ -387,6 +481,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_calibration_progress(
         self,
         frame: np.ndarray,
@@ -409,13 +504,11 @@ class DisplayManager:
         h, w = frame.shape[:2]
 
         # Overlay escuro
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
+        frame = self._darken(frame, 0.3)
 
         # Título
         title = "CONFIGURANDO SISTEMA"
-        (tw, th), _ = cv2.getTextSize(title, self.FONT, 1.2, 2)
+        (tw, th), _ = _text_size(title, self.FONT, 1.2, 2)
         cv2.putText(
             frame,
             title,
@@ -428,7 +521,7 @@ class DisplayManager:
 
         # Subtítulo
         subtitle = "Calibrando posicao da cama..."
-        (stw, sth), _ = cv2.getTextSize(subtitle, self.FONT, self.FONT_SCALE_MEDIUM, 1)
+        (stw, sth), _ = _text_size(subtitle, self.FONT, self.FONT_SCALE_MEDIUM, 1)
         cv2.putText(
             frame,
             subtitle,
@@ -445,24 +538,11 @@ class DisplayManager:
         bar_x = (w - bar_width) // 2
         bar_y = h // 2 + 20
 
-        # Background da barra
-        cv2.rectangle(
-            frame,
-            (bar_x, bar_y),
-            (bar_x + bar_width, bar_y + bar_height),
-            (80, 80, 80),
-            -1,
-        )
-
-        # Progresso
+        # Background e progresso por fatia (cantos inclusivos, como no cv2.rectangle)
         progress_width = int((current / total) * bar_width)
-        cv2.rectangle(
-            frame,
-            (bar_x, bar_y),
-            (bar_x + progress_width, bar_y + bar_height),
-            (0, 255, 0),
-            -1,
-        )
+        bar_rows = frame[max(bar_y, 0):max(bar_y + bar_height + 1, 0)]
+        bar_rows[:, max(bar_x, 0):max(bar_x + bar_width + 1, 0)] = (80, 80, 80)
+        bar_rows[:, max(bar_x, 0):max(bar_x + progress_width + 1, 0)] = (0, 255, 0)
 
         # Borda da barra
         cv2.rectangle(
@@ -474,7 +554,7 @@ class DisplayManager:
         )
 
         # Texto de progresso
-        (ptw, pth), _ = cv2.getTextSize(progress_text, self.FONT, self.FONT_SCALE_SMALL, 1)
+        (ptw, pth), _ = _text_size(progress_text, self.FONT, self.FONT_SCALE_SMALL, 1)
         cv2.putText(
             frame,
             progress_text,
@@ -487,6 +567,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_log_feedback(
         self,
         frame: np.ndarray,
@@ -508,7 +589,7 @@ class DisplayManager:
 
         # Box de feedback
         text = f"Evento #{event_count} - {label}"
-        (tw, th), _ = cv2.getTextSize(text, self.FONT, self.FONT_SCALE_MEDIUM, 1)
+        (tw, th), _ = _text_size(text, self.FONT, self.FONT_SCALE_MEDIUM, 1)
 
         x = w - tw - 30
         y = h - 50
@@ -526,6 +607,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_keypoints(
         self,
         frame: np.ndarray,
@@ -546,18 +628,27 @@ class DisplayManager:
             Frame com keypoints desenhados.
         """
         # Cores baseadas no estado
-        state_color = StateMachine.get_pose_state_color(pose_state)
+        state_color = self._pose_color[pose_state]
+
+        # Pontos detectados, na ordem de desenho
+        candidates = (
+            (body_points.neck, body_points.neck_conf, "NEC"),
+            (body_points.left_shoulder, body_points.left_shoulder_conf, "LSH"),
+            (body_points.right_shoulder, body_points.right_shoulder_conf, "RSH"),
+            (body_points.hip_center, body_points.hip_conf, "HIP"),
+            (body_points.left_knee, body_points.left_knee_conf, "LKN"),
+            (body_points.right_knee, body_points.right_knee_conf, "RKN"),
+            (body_points.left_ankle, body_points.left_ankle_conf, "LAN"),
+            (body_points.right_ankle, body_points.right_ankle_conf, "RAN"),
+        )
+        present = [c for c in candidates if c[0]]
 
-        # Cor verde para dentro da cama, laranja para fora
-        COLOR_IN_BED = (0, 255, 0)     # Verde
-        COLOR_OUT_BED = (0, 165, 255)  # Laranja
-        COLOR_LOW_CONF = (128, 128, 128)  # Cinza para baixa confianca
+        if present:
+            pts = np.array([c[0] for c in present], dtype=np.float64)
+            confs = np.array([c[1] for c in present], dtype=np.float64)
 
-        def is_in_bed(point):
-            if point is None:
-                return None
+            # Teste dentro/fora da cama (com margem de 10%) para todos os pontos de uma vez
             x1, y1, x2, y2 = bed_bbox
-            px, py = point
             margin = 0.1
             bed_width = x2 - x1
             bed_height = y2 - y1
@@ -565,57 +656,33 @@ class DisplayManager:
             x2_exp = x2 + bed_width * margin
             y1_exp = y1 - bed_height * margin
             y2_exp = y2 + bed_height * margin
-            return x1_exp <= px <= x2_exp and y1_exp <= py <= y2_exp
-
-        def draw_point(point, conf, name):
-            if point is None:
-                return
-            px, py = int(point[0]), int(point[1])
-
-            # Determina cor baseada em confianca e posicao
-            if conf < POSE_CONFIDENCE_HIGH:
-                color = COLOR_LOW_CONF
-                radius = 5
-            elif is_in_bed(point):
-                color = COLOR_IN_BED
-                radius = 8
-            else:
-                color = COLOR_OUT_BED
-                radius = 8
+            in_bed = (
+                (pts[:, 0] >= x1_exp) & (pts[:, 0] <= x2_exp)
+                & (pts[:, 1] >= y1_exp) & (pts[:, 1] <= y2_exp)
+            )
+            high_conf = confs >= POSE_CONFIDENCE_HIGH
 
-            # Desenha circulo
-            cv2.circle(frame, (px, py), radius, color, -1)
-            cv2.circle(frame, (px, py), radius, (0, 0, 0), 1)
+            # Indice em KEYPOINT_STYLES: 0 = baixa confianca, 1 = fora, 2 = dentro
+            style_idx = high_conf * (1 + in_bed)
 
-            # Label pequeno
-            label = name[:3].upper()
-            cv2.putText(
-                frame,
-                label,
-                (px + 10, py + 5),
-                self.FONT,
-                0.4,
-                color,
-                1,
-            )
+            for (point, _, name), idx in zip(present, style_idx.tolist()):
+                px, py = int(point[0]), int(point[1])
+                color, radius = self.KEYPOINT_STYLES[idx]
 
-        # Desenha cada ponto
-        if body_points.neck:
-            draw_point(body_points.neck, body_points.neck_conf, "NEC")
-        if body_points.left_shoulder:
-            draw_point(body_points.left_shoulder, body_points.left_shoulder_conf, "LSH")
-        if body_points.right_shoulder:
-            draw_point(body_points.right_shoulder, body_points.right_shoulder_conf, "RSH")
-        if body_points.hip_center:
-            draw_point(body_points.hip_center, body_points.hip_conf, "HIP")
-        if body_points.left_knee:
-            draw_point(body_points.left_knee, body_points.left_knee_conf, "LKN")
-        if body_points.right_knee:
-            draw_point(body_points.right_knee, body_points.right_knee_conf, "RKN")
-        if body_points.left_ankle:
-            draw_point(body_points.left_ankle, body_points.left_ankle_conf, "LAN")
-        if body_points.right_ankle:
-            draw_point(body_points.right_ankle, body_points.right_ankle_conf, "RAN")
+                # Desenha circulo
+                cv2.circle(frame, (px, py), radius, color, -1)
+                cv2.circle(frame, (px, py), radius, (0, 0, 0), 1)
+
+                # Label pequeno (nomes ja sao abreviados)
+                cv2.putText(
+                    frame,
+                    name,
+                    (px + 10, py + 5),
+                    self.FONT,
+                    0.4,
+                    color,
+                    1,
+                )
 
         # Desenha linhas conectando pontos principais (esqueleto simplificado)
         if body_points.neck and body_points.hip_center:
@@ -626,6 +693,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_pose_state_message(
         self,
         frame: np.ndarray,
@@ -641,44 +709,29 @@ class DisplayManager:
         Returns:
             Frame com mensagem de estado.
         """
-        messages = {
-            PatientPoseState.AGUARDANDO: "Aguardando paciente...",
-            PatientPoseState.MONITORANDO: "Paciente em monitoramento",
-            PatientPoseState.RISCO_POTENCIAL: "ATENCAO: Risco de queda",
-            PatientPoseState.PACIENTE_FORA: "ALERTA: Paciente fora da cama!",
-            PatientPoseState.ACOMPANHADO: "Paciente acompanhado",
-        }
-
         colors = StateMachine.POSE_STATE_COLORS
 
-        message = messages.get(pose_state, "Estado desconhecido")
+        message = self.POSE_STATE_MESSAGES.get(pose_state, "Estado desconhecido")
         color = colors.get(pose_state, (255, 255, 255))
 
         h, w = frame.shape[:2]
 
         # Posicao da mensagem (parte inferior central)
-        (tw, th), _ = cv2.getTextSize(message, self.FONT, self.FONT_SCALE_LARGE, 2)
+        size = self._pose_msg_sizes.get(pose_state)
+        if size is None:
+            size, _ = _text_size(message, self.FONT, self.FONT_SCALE_LARGE, 2)
+        tw, th = size
         x = (w - tw) // 2
         y = h - 30
 
-        # Fundo para melhor visibilidade
+        # Fundo para melhor visibilidade (fatia direta; cantos inclusivos)
         padding = 10
-        cv2.rectangle(
-            frame,
-            (x - padding, y - th - padding),
-            (x + tw + padding, y + padding),
-            (0, 0, 0),
-            -1,
-        )
+        x0, y0 = x - padding, y - th - padding
+        x1, y1 = x + tw + padding, y + padding
+        frame[max(y0, 0):max(y1 + 1, 0), max(x0, 0):max(x1 + 1, 0)] = 0
 
         # Borda colorida
-        cv2.rectangle(
-            frame,
-            (x - padding, y - th - padding),
-            (x + tw + padding, y + padding),
-            color,
-            2,
-        )
+        cv2.rectangle(frame, (x0, y0), (x1, y1), color, 2)
 
         # Texto
         cv2.putText(
@@ -693,6 +746,7 @@ class DisplayManager:
 
         return frame
 
+    @_skip_if_headless
     def draw_pose_dashboard(
         self,
         frame: np.ndarray,
@@ -714,53 +768,16 @@ class DisplayManager:
         """
         h, w = frame.shape[:2]
 
-        # Cria painel lateral
-        dashboard = np.full((h, self.dashboard_width, 3), self.COLOR_DASHBOARD_BG, dtype=np.uint8)
-
-        # Titulo
-        cv2.putText(
-            dashboard,
-            "POSE MONITOR",
-            (10, 30),
-            self.FONT,
-            self.FONT_SCALE_MEDIUM,
-            self.COLOR_TEXT,
-            1,
-        )
-        cv2.line(dashboard, (10, 40), (self.dashboard_width - 10, 40), self.COLOR_TEXT, 1)
+        # Textos dinamicos: (texto, posicao, escala, cor); desenhados de uma vez no final
+        texts = []
 
         # Estado atual
-        state_color = StateMachine.get_pose_state_color(pose_state)
-        cv2.putText(
-            dashboard,
-            f"Estado:",
-            (10, 65),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            self.COLOR_TEXT,
-            1,
-        )
-        cv2.putText(
-            dashboard,
-            f"{pose_state.value}",
-            (10, 85),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            state_color,
-            1,
-        )
+        state_color = self._pose_color[pose_state]
+        texts.append((f"{pose_state.value}", (10, 85), self.FONT_SCALE_SMALL, state_color))
 
         # Modo ocluso
         if analysis and analysis.occluded_mode:
-            cv2.putText(
-                dashboard,
-                "MODO OCLUSO",
-                (10, 100),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                (0, 255, 255),  # Amarelo
-                1,
-            )
+            texts.append(("MODO OCLUSO", (10, 100), self.FONT_SCALE_SMALL, (0, 255, 255)))  # Amarelo
 
         # Calcula posição do separador
         y_sep = 115 if (analysis and analysis.occluded_mode) else 100
@@ -783,8 +800,7 @@ class DisplayManager:
                 detail += f" OV:{analysis.person_bed_overlap:.0%}"
             if analysis.person_bed_containment is not None:
                 detail += f" CT:{analysis.person_bed_containment:.0%}"
-            cv2.putText(dashboard, posture_text + detail, (10, y_sep),
-                        self.FONT, self.FONT_SCALE_SMALL, posture_color, 1)
+            texts.append((posture_text + detail, (10, y_sep), self.FONT_SCALE_SMALL, posture_color))
             y_sep += 15
 
         # Postura sentada (ângulo ou neck height)
@@ -796,30 +812,20 @@ class DisplayManager:
             else:
                 sit_text = "SENTADO"
             sit_color = (0, 165, 255)   # Laranja
-            cv2.putText(dashboard, sit_text, (10, y_sep),
-                        self.FONT, self.FONT_SCALE_SMALL, sit_color, 1)
+            texts.append((sit_text, (10, y_sep), self.FONT_SCALE_SMALL, sit_color))
             y_sep += 15
         elif analysis and analysis.torso_hip_knee_angle is not None:
             sit_text = f"Angulo: {analysis.torso_hip_knee_angle:.0f}deg"
             sit_color = (0, 255, 0)     # Verde
-            cv2.putText(dashboard, sit_text, (10, y_sep),
-                        self.FONT, self.FONT_SCALE_SMALL, sit_color, 1)
+            texts.append((sit_text, (10, y_sep), self.FONT_SCALE_SMALL, sit_color))
             y_sep += 15
 
         # Separador
-        cv2.line(dashboard, (10, y_sep), (self.dashboard_width - 10, y_sep), self.COLOR_TEXT, 1)
+        separators = [y_sep]
 
         # Pontos do corpo
         y_pos = y_sep + 25
-        cv2.putText(
-            dashboard,
-            "Keypoints:",
-            (10, y_pos),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            self.COLOR_TEXT,
-            1,
-        )
+        texts.append(("Keypoints:", (10, y_pos), self.FONT_SCALE_SMALL, self.COLOR_TEXT))
         y_pos += 25
 
         if body_points:
@@ -849,66 +855,73 @@ class DisplayManager:
                     status = "FORA"
                     color = (0, 165, 255)
 
-                text = f"{name}: {status}"
-                cv2.putText(
-                    dashboard,
-                    text,
-                    (10, y_pos),
-                    self.FONT,
-                    0.4,
-                    color,
-                    1,
-                )
+                texts.append((f"{name}: {status}", (10, y_pos), 0.4, color))
                 y_pos += 20
         else:
-            cv2.putText(
-                dashboard,
-                "Sem deteccao",
-                (10, y_pos),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                (128, 128, 128),
-                1,
-            )
+            texts.append(("Sem deteccao", (10, y_pos), self.FONT_SCALE_SMALL, (128, 128, 128)))
 
         # Separador
         y_pos += 10
-        cv2.line(dashboard, (10, y_pos), (self.dashboard_width - 10, y_pos), self.COLOR_TEXT, 1)
+        separators.append(y_pos)
         y_pos += 25
 
         # Resumo da analise
         if analysis:
-            cv2.putText(
-                dashboard,
-                f"Pontos: {analysis.points_monitored}",
-                (10, y_pos),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                self.COLOR_TEXT,
-                1,
-            )
-            y_pos += 20
+            outside_color = (0, 165, 255) if analysis.points_outside > 0 else self.COLOR_TEXT
+            texts.append((f"Pontos: {analysis.points_monitored}", (10, y_pos), self.FONT_SCALE_SMALL, self.COLOR_TEXT))
+            texts.append((f"Dentro: {analysis.points_inside}", (10, y_pos + 20), self.FONT_SCALE_SMALL, (0, 255, 0)))
+            texts.append((f"Fora: {analysis.points_outside}", (10, y_pos + 40), self.FONT_SCALE_SMALL, outside_color))
+
+        # So re-renderiza o painel quando algo visivel mudou
+        key = (h, pose_state, tuple(texts), tuple(separators))
+        if not self._can_reuse_panel(self._pose_dashboard_cache, key):
+            # Painel lateral a partir do fundo estatico pre-renderizado
+            template = self._pose_dashboard_template_cache.get(h)
+            if template is None:
+                template = self._pose_dashboard_template_cache[h] = self._build_pose_dashboard_template(h)
+            dashboard = self._reset_panel(self._pose_dashboard_cache, template)
+            for y_line in separators:
+                cv2.line(dashboard, (10, y_line), (self.dashboard_width - 10, y_line), self.COLOR_TEXT, 1)
+            self._put_texts(dashboard, texts)
+            self._pose_dashboard_cache = (key, dashboard)
+        dashboard = self._pose_dashboard_cache[1]
 
-            cv2.putText(
-                dashboard,
-                f"Dentro: {analysis.points_inside}",
-                (10, y_pos),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                (0, 255, 0),
-                1,
-            )
-            y_pos += 20
+        # Concatena dashboard ao frame
+        return self._compose(frame, dashboard)
 
-            cv2.putText(
-                dashboard,
-                f"Fora: {analysis.points_outside}",
-                (10, y_pos),
-                self.FONT,
-                self.FONT_SCALE_SMALL,
-                (0, 165, 255) if analysis.points_outside > 0 else self.COLOR_TEXT,
-                1,
-            )
+    def _build_pose_dashboard_template(self, h: int) -> np.ndarray:
+        """
+        Renderiza as partes estaticas do dashboard de pose.
+
+        Args:
+            h: Altura do frame (o painel acompanha a altura do video).
+
+        Returns:
+            Painel com titulo, rotulo de estado e legenda de controles.
+        """
+        dashboard = np.full((h, self.dashboard_width, 3), self.COLOR_DASHBOARD_BG, dtype=np.uint8)
+
+        # Titulo
+        cv2.putText(
+            dashboard,
+            "POSE MONITOR",
+            (10, 30),
+            self.FONT,
+            self.FONT_SCALE_MEDIUM,
+            self.COLOR_TEXT,
+            1,
+        )
+        cv2.line(dashboard, (10, 40), (self.dashboard_width - 10, 40), self.COLOR_TEXT, 1)
+
+        cv2.putText(
+            dashboard,
+            "Estado:",
+            (10, 65),
+            self.FONT,
+            self.FONT_SCALE_SMALL,
+            self.COLOR_TEXT,
+            1,
+        )
 
         # Controles no final
         y_pos = h - 60
@@ -935,9 +948,9 @@ class DisplayManager:
                 1,
             )
 
-        # Concatena dashboard ao frame
-        return np.hstack([frame, dashboard])
+        return dashboard
 
+    @_skip_if_headless
     def draw_ema_scores(
         self,
         frame: np.ndarray,
@@ -965,10 +978,9 @@ class DisplayManager:
         if x < 10:
             x = 10
 
-        # Fundo semi-transparente
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (x - 10, y - 20), (x + 160, y + 95), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
+        # Fundo semi-transparente (escurece so a regiao do painel, in-place)
+        roi = frame[y - 20:y + 96, x - 10:x + 161]
+        self._darken(roi, 0.4)
 
         # Titulo
         cv2.putText(
@@ -1007,8 +1019,10 @@ class DisplayManager:
             # Barra de progresso
             bar_x = x + 40
             bar_fill = int(score * bar_width)
-            cv2.rectangle(frame, (bar_x, y_item - 10), (bar_x + bar_width, y_item), (60, 60, 60), -1)
-            cv2.rectangle(frame, (bar_x, y_item - 10), (bar_x + bar_fill, y_item), color, -1)
+            # Preenchimento direto por fatia (cantos inclusivos, como no cv2.rectangle)
+            bar_rows = frame[y_item - 10:y_item + 1]
+            bar_rows[:, bar_x:bar_x + bar_width + 1] = (60, 60, 60)
+            bar_rows[:, bar_x:bar_x + bar_fill + 1] = color
 
             # Valor
             cv2.putText(
@@ -1023,33 +1037,107 @@ class DisplayManager:
 
         return frame
 
-        # Controles no final
-        y_pos = h - 60
-        cv2.line(dashboard, (10, y_pos - 10), (self.dashboard_width - 10, y_pos - 10), self.COLOR_TEXT, 1)
-        cv2.putText(
-            dashboard,
-            "CONTROLES",
-            (10, y_pos + 10),
-            self.FONT,
-            self.FONT_SCALE_SMALL,
-            self.COLOR_TEXT,
-            1,
+    def _can_reuse_panel(self, cache: Optional[Tuple[tuple, np.ndarray]], key: tuple) -> bool:
+        """
+        Decide se o painel em cache pode ser reaproveitado neste frame.
+
+        Conteúdo idêntico sempre reaproveita. Com DASHBOARD_RENDER_EVERY_N_FRAMES > 1,
+        métricas defasadas são toleradas entre renders, desde que altura e
+        estado (key[:2]) não tenham mudado.
+
+        Args:
+            cache: Tupla (chave, painel) do último render ou None.
+            key: Chave do conteúdo atual: (altura, estado, ...).
+
+        Returns:
+            True se pode reaproveitar, False se precisa re-renderizar.
+        """
+        self._dashboard_frame_count += 1
+        if cache is None:
+            return False
+        cached_key = cache[0]
+        if cached_key == key:
+            return True
+        return (
+            cached_key[:2] == key[:2]
+            and self._dashboard_frame_count % self._dashboard_interval != 0
         )
 
-        controls = ["[Q] Sair", "[R] Reset"]
-        for i, ctrl in enumerate(controls):
-            cv2.putText(
-                dashboard,
-                ctrl,
-                (10, y_pos + 30 + i * 15),
-                self.FONT,
-                0.4,
-                (200, 200, 200),
-                1,
-            )
+    @staticmethod
+    def _reset_panel(cache: Optional[Tuple[tuple, np.ndarray]], template: np.ndarray) -> np.ndarray:
+        """
+        Restaura o fundo estático no buffer do painel anterior.
 
-        # Concatena dashboard ao frame
-        return np.hstack([frame, dashboard])
+        O painel em cache só é lido por _compose (que copia para o buffer de
+        saída), então pode ser sobrescrito; aloca apenas quando a altura muda.
+
+        Args:
+            cache: Tupla (chave, painel) do último render ou None.
+            template: Fundo estático para a altura atual.
+
+        Returns:
+            Buffer do painel com o conteúdo do template.
+        """
+        if cache is not None and cache[1].shape == template.shape:
+            panel = cache[1]
+            np.copyto(panel, template)
+            return panel
+        return template.copy()
+
+    def _put_texts(self, img: np.ndarray, items, thickness: int = 1) -> None:
+        """
+        Desenha uma lista de textos com a fonte padrão, na ordem dada.
+
+        Args:
+            img: Imagem de destino (modificada in-place).
+            items: Iterável de (texto, (x, y), escala, cor BGR).
+            thickness: Espessura do traço.
+        """
+        font = self.FONT
+        put_text = cv2.putText
+        for text, org, scale, color in items:
+            put_text(img, text, org, font, scale, color, thickness)
+
+    @staticmethod
+    def _darken(frame: np.ndarray, alpha: float = 0.3) -> np.ndarray:
+        """
+        Escurece o frame multiplicando cada pixel por alpha.
+
+        Equivale a misturar com um overlay preto via addWeighted, sem
+        alocar e preencher o overlay. Escreve no próprio frame (aceita
+        também views/ROIs), então não aloca nenhum buffer por chamada.
+
+        Args:
+            frame: Frame de vídeo (modificado in-place).
+            alpha: Fração do brilho mantida (0.3 = escurece 70%).
+
+        Returns:
+            O mesmo frame, escurecido.
+        """
+        return cv2.convertScaleAbs(frame, dst=frame, alpha=alpha, beta=0)
+
+    def _compose(self, frame: np.ndarray, dashboard: np.ndarray) -> np.ndarray:
+        """
+        Copia frame e dashboard lado a lado num buffer pré-alocado.
+
+        Equivale a np.hstack([frame, dashboard]) sem alocar a saída a cada frame.
+        O buffer é sobrescrito na próxima chamada, e draw_ema_scores/_darken
+        escrevem in place sobre ele: quem guardar o retorno além do frame atual
+        precisa copiá-lo (como faz a fila de imagens do AlertLogger).
+
+        Args:
+            frame: Frame de vídeo.
+            dashboard: Painel lateral com a mesma altura do frame.
+
+        Returns:
+            Frame com dashboard à direita.
+        """
+        h, w = frame.shape[:2]
+        shape = (h, w + dashboard.shape[1], 3)
+        if self._composite_buf is None or self._composite_buf.shape != shape:
+            self._composite_buf = np.empty(shape, dtype=np.uint8)
+
+        return np.concatenate((frame, dashboard), axis=1, out=self._composite_buf)
 
     def _get_pose_state_color_bgr(self, state: PatientPoseState) -> Tuple[int, int, int]:
         """Retorna cor BGR para o estado de pose."""
@@ -1084,16 +1172,31 @@ class DisplayManager:
         """
         return not self.skip_rendering
 
+    @contextmanager
+    def force_rendering(self, enabled: bool = True) -> Iterator[None]:
+        """
+        Executa os draw_* mesmo com skip_rendering ativo.
+
+        Usado para anotar frames que viram evidência (imagens de alerta)
+        em modo headless.
+
+        Args:
+            enabled: Se False, o contexto não altera nada.
+        """
+        previous = self._force_rendering
+        self._force_rendering = previous or enabled
+        try:
+            yield
+        finally:
+            self._force_rendering = previous
+
     def close(self) -> None:
-        """Fecha a janela de exibição."""
+        """Fecha a janela de exibição e libera os buffers reaproveitados."""
         self._display.destroy_all()
+        self._dashboard_cache = None
+        self._pose_dashboard_cache = None
+        self._composite_buf = None
 
     def _get_state_color_bgr(self, state: PatientState) -> Tuple[int, int, int]:
         """Retorna cor BGR para o estado."""
-        colors = {
-            PatientState.VAZIO: (128, 128, 128),
-            PatientState.REPOUSO: (0, 255, 0),
-            PatientState.ALERTA: (0, 255, 255),
-            PatientState.CRITICO: (0, 0, 255),
-        }
-        return colors.get(state, (255, 255, 255))
+        return self.STATE_COLORS.get(state, (255, 255, 255))
@@ -19,6 +19,7 @@ Controles:
 
 import logging
 import os
+import queue
 import sys
 import time
 import traceback
@@ -26,6 +27,10 @@ import warnings
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Carrega config antes de cv2/numpy/ultralytics: define os limites de threads
+# (OMP_NUM_THREADS etc.) que essas bibliotecas leem ao serem importadas
+import config  # noqa: F401
+
 import cv2
 import numpy as np
 
@@ -41,7 +46,9 @@ if platform.system() == "Linux" and not os.environ.get("DISPLAY"):
 from ultralytics import YOLO
 
 from config import (
+    BED_DETECT_EVERY_N_FRAMES,
     BED_STANDBY_RETRY_SECONDS,
+    CALIBRATION_BUFFER_DTYPE,
     CALIBRATION_CONSISTENCY_MAX_DIST,
     CALIBRATION_CONSISTENCY_VARIANCE,
     CALIBRATION_FRAMES,
@@ -51,21 +58,35 @@ from config import (
     CALIBRATION_SUCCESS_DISPLAY_SECONDS,
     CAMERA_BACKEND,
     CAMERA_INDEX,
+    CAPTURE_HEIGHT,
+    CAPTURE_PIXEL_FORMAT,
+    CAPTURE_WIDTH,
+    CV2_NUM_THREADS,
     DEV_MODE,
     DEV_SKIP_BED_DETECTION,
+    DISPLAY_POLL_INTERVAL,
+    DISPLAY_SKIP_WHEN_HEADLESS,
     DISPLAY_WAIT_TIMEOUT,
     FLIP_HORIZONTAL,
-    FRAME_DELAY_SECONDS,
+    FLIP_VIA_SENSOR,
+    FRAME_BUDGET_SECONDS,
+    HEADLESS,
+    LOG_LEVEL,
+    MODEL_PRECISION,
+    MODEL_PRECISIONS,
+    OVERRUN_WARN_THRESHOLD,
+    POSE_ASYNC_PIPELINE,
     POSE_CONFIDENCE_HIGH,
     POSE_CONFIDENCE_MIN,
     POSE_FRAMES_PATIENT_DETECTED,
     POSE_FRAMES_TO_CONFIRM,
+    POSE_PIPELINE_TIMEOUT,
+    TARGET_FPS,
     WINDOW_NAME,
     YOLO_ASETO_MODEL,
     YOLO_BED_MODEL,
-    YOLO_MODEL,
-    YOLO_POSE_CONFIDENCE,
     YOLO_POSE_MODEL,
+    YOLO_POSE_MODEL_INT8,
 )
 from gui.display import DisplayManager
 from modules.alert_logger import AlertLogger
@@ -75,6 +96,7 @@ from modules.environment import get_environment_id
 from modules.gpio_alerts import GPIOAlertManager
 from modules.patient_monitor import PatientMonitor
 from modules.pose_analyzer import BodyPoints, PoseAnalyzer, PoseStateMachineEMA, PositionAnalysis
+from modules.pose_pipeline import FramePacer, PoseDetections, PosePipeline
 from modules.state_machine import PatientPoseState, SystemState
 
 
@@ -96,12 +118,21 @@ ERROR_RECOVERY_DELAY = 1  # Segundos para aguardar antes de tentar novamente
 
 # Configura logging de erros
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format="%(asctime)s | %(levelname)s | %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 logger = logging.getLogger("HospitalMonitor")
 
+# Limita o pool de threads do OpenCV (evita disputa de nucleos com o YOLO)
+# e garante os caminhos SIMD (NEON no Pi), caso o build os deixe desligados
+cv2.setNumThreads(CV2_NUM_THREADS)
+cv2.setUseOptimized(True)
+
+# Teclas de controle (codigos do waitKey)
+_QUIT_KEYS = frozenset((ord("q"), ord("Q")))
+_RESET_KEYS = frozenset((ord("r"), ord("R")))
+
 
 # =============================================================================
 # FUNCOES DE RESILIENCIA
@@ -110,8 +141,10 @@ logger = logging.getLogger("HospitalMonitor")
 def normalize_frame_for_ir(frame: np.ndarray) -> np.ndarray:
     """Corrige balanco de branco e contraste para cameras IR.
     1) Equaliza medias dos canais BGR (remove tonalidade roxa)
-    2) Aplica CLAHE no canal L (melhora contraste local)"""
-    result = frame.copy()
+    2) Aplica CLAHE no canal L (melhora contraste local)
+    O balanco de canais e feito in place: o frame de entrada e alterado
+    (quem precisa do original guarda uma copia antes, como o raw_frame)."""
+    result = frame
     avg_per_channel = result.mean(axis=(0, 1))
     global_avg = avg_per_channel.mean()
     for i in range(3):
@@ -171,7 +204,12 @@ def log_exception(context: str, exc: Exception) -> None:
     logger.debug(traceback.format_exc())
 
 
-def safe_cleanup(camera: Optional[CameraBase], display: Optional[DisplayManager], gpio_manager: Optional['GPIOAlertManager'] = None) -> None:
+def safe_cleanup(
+    camera: Optional[CameraBase],
+    display: Optional[DisplayManager],
+    gpio_manager: Optional['GPIOAlertManager'] = None,
+    alert_logger: Optional[AlertLogger] = None,
+) -> None:
     """
     Libera recursos de forma segura.
 
@@ -179,6 +217,7 @@ def safe_cleanup(camera: Optional[CameraBase], display: Optional[DisplayManager]
         camera: Instancia da camera (pode ser None)
         display: Instancia do display (pode ser None)
         gpio_manager: Instancia do gerenciador GPIO (pode ser None)
+        alert_logger: Instancia do logger de alertas (pode ser None)
     """
     try:
         if camera is not None:
@@ -202,6 +241,12 @@ def safe_cleanup(camera: Optional[CameraBase], display: Optional[DisplayManager]
     except Exception:
         pass
 
+    try:
+        if alert_logger is not None:
+            alert_logger.close()
+    except Exception:
+        pass
+
 
 # =============================================================================
 # FUNCOES PRINCIPAIS
@@ -219,21 +264,16 @@ def _find_consistent_clusters(
     assigned = [False] * n
     clusters = []
 
+    # Matriz de proximidade (maior diferenca entre coordenadas) calculada uma vez
+    close = np.abs(bboxes[:, None, :] - bboxes[None, :, :]).max(axis=2) <= max_dist
+
     for i in range(n):
         if assigned[i]:
             continue
         cluster = [i]
         assigned[i] = True
         for j in range(i + 1, n):
-            if assigned[j]:
-                continue
-            close_to_all = True
-            for k in cluster:
-                dist = np.max(np.abs(bboxes[j] - bboxes[k]))
-                if dist > max_dist:
-                    close_to_all = False
-                    break
-            if close_to_all:
+            if not assigned[j] and close[j, cluster].all():
                 cluster.append(j)
                 assigned[j] = True
         clusters.append(cluster)
@@ -242,13 +282,13 @@ def _find_consistent_clusters(
 
 
 def _calibrate_standard(
-    detections: list,
+    detections: np.ndarray,
     num_frames: int,
     min_detections: int,
     max_variance: float,
 ) -> Optional[Tuple[int, int, int, int]]:
     """Calibracao padrao: filtra outliers via IQR, aceita se variancia baixa."""
-    bboxes = np.array(detections)
+    bboxes = detections
     median_bbox = np.median(bboxes, axis=0)
     q1 = np.percentile(bboxes, 25, axis=0)
     q3 = np.percentile(bboxes, 75, axis=0)
@@ -280,13 +320,13 @@ def _calibrate_standard(
 
 
 def _calibrate_consistency(
-    detections: list,
+    detections: np.ndarray,
     max_dist: float = CALIBRATION_CONSISTENCY_MAX_DIST,
     min_consistent: int = CALIBRATION_MIN_CONSISTENT,
     max_variance: float = CALIBRATION_CONSISTENCY_VARIANCE,
 ) -> Optional[Tuple[int, int, int, int]]:
     """Calibracao por consistencia: aceita cluster de deteccoes espacialmente proximas."""
-    bboxes = np.array(detections)
+    bboxes = detections
     clusters = _find_consistent_clusters(bboxes, max_dist)
 
     print(f"    [consistencia] {len(detections)} deteccoes -> {len(clusters)} cluster(s)")
@@ -347,18 +387,18 @@ def calibrate_bed(
     Returns:
         Tuple (x1, y1, x2, y2) com bbox médio se estável, None se instável.
     """
-    detections = []
+    # Buffer pre-alocado (num_frames, 4): uma linha por deteccao
+    detections = np.empty((num_frames, 4), dtype=CALIBRATION_BUFFER_DTYPE)
+    num_detections = 0
+    pacer = FramePacer()
 
     for i in range(num_frames):
         try:
+            pacer.wait()
             ret, frame = camera.read()
             if not ret or frame is None:
                 continue
 
-            # Aplica flip horizontal se configurado
-            if FLIP_HORIZONTAL:
-                frame = cv2.flip(frame, 1)
-
             # Frame cru para ASETO (antes da normalização IR)
             raw_frame = frame.copy()
 
@@ -368,7 +408,8 @@ def calibrate_bed(
             bbox = bed_detector.detect_bed(frame, raw_frame=raw_frame, diagnostic=True)
 
             if bbox:
-                detections.append(bbox)
+                detections[num_detections] = bbox
+                num_detections += 1
 
             # Exibe frame com progresso
             progress_text = f"Frame {i + 1}/{num_frames}"
@@ -376,18 +417,18 @@ def calibrate_bed(
             key = display.render(frame)
 
             # Permite sair durante calibração
-            if key == ord("q") or key == ord("Q"):
+            if key in _QUIT_KEYS:
                 return None
 
             # Heartbeat durante calibracao
             send_heartbeat()
 
-            time.sleep(FRAME_DELAY_SECONDS)
-
         except Exception as e:
             log_exception("Erro durante calibracao", e)
             continue
 
+    detections = detections[:num_detections]
+
     # --- Logica de aceitacao dual ---
     min_detections = int(num_frames * CALIBRATION_MIN_DETECTION_RATE)
 
@@ -478,6 +519,25 @@ def _kill_previous_camera_processes() -> None:
         print("[Startup] Nenhuma instancia anterior encontrada")
 
 
+def get_pose_model_path() -> str:
+    """
+    Retorna o modelo de pose conforme MODEL_PRECISION.
+
+    Usa o TFLite INT8 quando selecionado e exportado; caso contrario,
+    YOLO_POSE_MODEL (NCNN no ARM ou .pt). fp16 so muda PREDICT_KWARGS (half=True).
+
+    Raises:
+        ValueError: Se MODEL_PRECISION nao for um de MODEL_PRECISIONS
+    """
+    if MODEL_PRECISION not in MODEL_PRECISIONS:
+        raise ValueError(
+            f"MVISION_PRECISION invalido: {MODEL_PRECISION!r} (use {', '.join(MODEL_PRECISIONS)})"
+        )
+    if MODEL_PRECISION == "int8" and Path(YOLO_POSE_MODEL_INT8).exists():
+        return YOLO_POSE_MODEL_INT8
+    return YOLO_POSE_MODEL
+
+
 def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayManager, AlertLogger, GPIOAlertManager]:
     """
     Inicializa todos os componentes do sistema.
@@ -489,8 +549,12 @@ def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayMan
         Exception: Se falhar ao inicializar algum componente
     """
     # No Linux, aguarda X11 estar pronto (serviço pode iniciar antes do desktop)
-    if IS_LINUX:
-        display_available = wait_for_display(timeout_seconds=DISPLAY_WAIT_TIMEOUT, check_interval=5)
+    if IS_LINUX and not HEADLESS:
+        display_available = wait_for_display(
+            timeout_seconds=DISPLAY_WAIT_TIMEOUT,
+            check_interval=DISPLAY_POLL_INTERVAL,
+            skip_when_headless=DISPLAY_SKIP_WHEN_HEADLESS,
+        )
         if display_available:
             logger.info("Display X11 disponível - modo GUI ativo")
         else:
@@ -512,12 +576,21 @@ def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayMan
 
     # 1. Inicialização da câmera
     print("\n[1/4] Inicializando camera...")
-    camera = create_camera(CAMERA_INDEX, backend=CAMERA_BACKEND)
+    # Flip horizontal aplicado pela propria camera (sensor no Picamera2, cv2.flip no OpenCV)
+    camera = create_camera(
+        CAMERA_INDEX,
+        backend=CAMERA_BACKEND,
+        pixel_format=CAPTURE_PIXEL_FORMAT,
+        hflip=FLIP_HORIZONTAL,
+        hflip_via_sensor=FLIP_VIA_SENSOR,
+    )
+
+    # Resolucao definida antes de abrir (evita reconfigurar o stream)
+    camera.set_resolution(CAPTURE_WIDTH, CAPTURE_HEIGHT)
 
     if not camera.open():
         raise RuntimeError("Nao foi possivel abrir a camera")
 
-    camera.set_resolution(640, 480)
     width, height = camera.get_resolution()
 
     print(f"    Camera inicializada com sucesso")
@@ -535,13 +608,14 @@ def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayMan
     else:
         logger.warning(f"Modelo ASETO nao encontrado em {YOLO_ASETO_MODEL} - usando apenas COCO")
 
-    yolo_pose = YOLO(YOLO_POSE_MODEL)
-    print(f"    Modelo {YOLO_POSE_MODEL} carregado (pose)")
+    pose_model_path = get_pose_model_path()
+    yolo_pose = YOLO(pose_model_path, task="pose")
+    print(f"    Modelo {pose_model_path} carregado (pose, precisao {MODEL_PRECISION})")
 
     # 3. Inicializa modulos
     print("\n[3/4] Inicializando modulos...")
     bed_detector = BedDetector(yolo, aseto_model=yolo_aseto)
-    display = DisplayManager(WINDOW_NAME)
+    display = DisplayManager(WINDOW_NAME, headless=HEADLESS)
     alert_logger = AlertLogger()
 
     print("    Modulos inicializados")
@@ -550,7 +624,7 @@ def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayMan
     if DEV_SKIP_BED_DETECTION:
         print("    Modo DEV_SKIP_BED_DETECTION ATIVO - deteccao de cama ignorada")
     if FLIP_HORIZONTAL:
-        print("    Flip horizontal ATIVO")
+        print(f"    Flip horizontal ATIVO ({'sensor' if camera.hflip_in_sensor else 'software'})")
 
     # Inicializa gerenciador GPIO
     gpio_manager = GPIOAlertManager()
@@ -558,6 +632,57 @@ def initialize_system() -> Tuple[CameraBase, YOLO, YOLO, BedDetector, DisplayMan
     return camera, yolo, yolo_pose, bed_detector, display, alert_logger, gpio_manager
 
 
+def _analyze_pose(
+    pose_analyzer: PoseAnalyzer,
+    detections: Optional[PoseDetections],
+) -> Tuple[Optional[BodyPoints], Optional[PositionAnalysis], int]:
+    """
+    Extrai pontos/analise do paciente das deteccoes do YOLOv8-Pose.
+
+    A inferencia (e a copia dos tensores para NumPy) roda no PosePipeline;
+    aqui fica so a parte com estado (EMA de confianca, zona da cama),
+    sempre na thread principal.
+
+    Returns:
+        Tupla (body_points, analysis, person_count)
+    """
+    body_points = None
+    analysis = None
+    person_count = 0
+    person_bbox = None
+
+    # Verifica se detectou pessoa com keypoints
+    if detections is not None:
+        boxes_xyxy = detections.boxes
+
+        # Filtra deteccoes duplicadas (bboxes sobrepostas da mesma pessoa)
+        raw_count = len(detections.keypoints)
+        if raw_count > 1 and boxes_xyxy is not None and len(boxes_xyxy) >= raw_count:
+            keep = _filter_overlapping_boxes(boxes_xyxy, iou_threshold=0.4)
+            person_count = len(keep)
+        else:
+            person_count = raw_count
+
+        if person_count == 1:
+            keypoints = detections.keypoints[0]
+
+            if detections.confidences is not None:
+                confidences = detections.confidences[0]
+            else:
+                confidences = np.ones(len(keypoints))
+
+            confidences = pose_analyzer.smooth_confidences(confidences)
+
+            # Extrai bbox da pessoa do resultado YOLO-Pose
+            if boxes_xyxy is not None:
+                person_bbox = tuple(boxes_xyxy[0].astype(int))
+
+            body_points = pose_analyzer.extract_body_points(keypoints, confidences)
+            analysis = pose_analyzer.analyze_position(body_points, person_bbox)
+
+    return body_points, analysis, person_count
+
+
 def run_monitoring_loop(
     camera: CameraBase,
     yolo_pose: YOLO,
@@ -604,6 +729,8 @@ def run_monitoring_loop(
     body_points: Optional[BodyPoints] = None
     analysis: Optional[PositionAnalysis] = None
     previous_pose_state: str = PoseStateMachineEMA.AGUARDANDO
+    pose_state: str = previous_pose_state
+    person_count = 0
     alert_feedback_until = 0
     last_alert_image = ""
 
@@ -614,203 +741,206 @@ def run_monitoring_loop(
     consecutive_capture_errors = 0
     consecutive_processing_errors = 0
 
-    # Log inicio do monitoramento
-    alert_logger.log_info("Sistema de monitoramento iniciado")
+    # Frames que estouraram o orcamento de tempo (FRAME_BUDGET_SECONDS)
+    overrun_count = 0
+    last_frame_time: Optional[float] = None
 
-    # Loop Principal de Monitoramento
-    while True:
-        try:
-            frame_start = time.time()
+    # Indice do ultimo frame em que o re-check da cama foi avaliado; por
+    # diferenca (e nao modulo) para nao perder a vez quando o pipeline descarta frames
+    last_bed_check_idx = -BED_DETECT_EVERY_N_FRAMES
 
-            # Envia heartbeat periodicamente
-            if time.time() - last_heartbeat > HEARTBEAT_INTERVAL:
-                send_heartbeat()
-                last_heartbeat = time.time()
-
-            ret, frame = camera.read()
-            if not ret or frame is None:
-                consecutive_capture_errors += 1
-                if consecutive_capture_errors <= 5 or consecutive_capture_errors % 10 == 0:
-                    logger.warning(f"Falha ao capturar frame ({consecutive_capture_errors}/{MAX_CONSECUTIVE_ERRORS})")
-
-                if consecutive_capture_errors >= MAX_CONSECUTIVE_ERRORS:
-                    logger.error("Muitos erros consecutivos de captura - tentando reiniciar sistema")
-                    return False
-
-                time.sleep(ERROR_RECOVERY_DELAY)
-                continue
-
-            # Reset contadores em captura bem-sucedida
-            consecutive_capture_errors = 0
-
-            # Aplica flip horizontal se configurado
-            if FLIP_HORIZONTAL:
-                frame = cv2.flip(frame, 1)
-
-            # Frame cru para ASETO (antes da normalização IR)
-            raw_frame = frame.copy()
+    # Log inicio do monitoramento
+    alert_logger.log_info("Sistema de monitoramento iniciado")
 
-            # Normaliza frame para cameras IR (remove distorcao de cor)
-            frame = normalize_frame_for_ir(frame)
+    # Captura + YOLO-Pose em thread propria (cadencia TARGET_FPS aplicada na captura)
+    pipeline = PosePipeline(
+        camera,
+        yolo_pose,
+        preprocess=normalize_frame_for_ir,
+        asynchronous=POSE_ASYNC_PIPELINE,
+    )
+    pipeline.start()
 
-            # Re-check da cama se necessario (ignorado em modo DEV_SKIP_BED_DETECTION)
-            if not DEV_SKIP_BED_DETECTION and bed_detector.needs_recheck():
-                result = bed_detector.detect_bed_detailed(frame, raw_frame=raw_frame)
-                if result is not None:
-                    new_bbox, class_name, confidence, score = result
-                    current_score = bed_detector.detected_score
-                    if (bed_detector.is_bbox_consistent(new_bbox) and
-                            score >= current_score):
-                        bed_detector._accept_detection(new_bbox, class_name, confidence, score)
-                        bed_bbox = new_bbox
-                        bed_detector.save_reference(bed_bbox)
-                        pose_analyzer.update_bed_bbox(bed_bbox)
-                        monitor.update_bed_bbox(bed_bbox)
-                        logger.info(f"Cama re-detectada: {bed_bbox} (score={score:.3f})")
-                    else:
-                        bed_detector.postpone_recheck()
-                        if not bed_detector.is_bbox_consistent(new_bbox):
-                            logger.info(f"Recheck ignorado: bbox inconsistente (IoU baixo)")
+    # Loop Principal de Monitoramento
+    try:
+        while True:
+            try:
+                # Envia heartbeat periodicamente
+                if time.time() - last_heartbeat > HEARTBEAT_INTERVAL:
+                    send_heartbeat()
+                    last_heartbeat = time.time()
+
+                # Frame ja capturado, normalizado e (se for a vez) inferido pelo pipeline
+                try:
+                    item = pipeline.get(timeout=POSE_PIPELINE_TIMEOUT)
+                except queue.Empty:
+                    item = None
+                if item is not None and item.error is not None:
+                    raise item.error
+
+                if item is None or not item.ok:
+                    consecutive_capture_errors += 1
+                    if consecutive_capture_errors <= 5 or consecutive_capture_errors % 10 == 0:
+                        logger.warning(f"Falha ao capturar frame ({consecutive_capture_errors}/{MAX_CONSECUTIVE_ERRORS})")
+
+                    if consecutive_capture_errors >= MAX_CONSECUTIVE_ERRORS:
+                        logger.error("Muitos erros consecutivos de captura - tentando reiniciar sistema")
+                        return False
+
+                    time.sleep(ERROR_RECOVERY_DELAY)
+                    continue
+
+                # Reset contadores em captura bem-sucedida
+                consecutive_capture_errors = 0
+
+                # Overrun: intervalo entre frames processados acima do orcamento
+                frame_time = time.perf_counter()
+                if last_frame_time is not None:
+                    period = frame_time - last_frame_time
+                    if period - FRAME_BUDGET_SECONDS > OVERRUN_WARN_THRESHOLD:
+                        overrun_count += 1
+                        if overrun_count <= 5 or overrun_count % 100 == 0:
+                            logger.warning(
+                                f"Frame excedeu orcamento de {TARGET_FPS} FPS: {period * 1000:.0f} ms "
+                                f"({overrun_count} ocorrencias) - considere reduzir imgsz"
+                            )
+                last_frame_time = frame_time
+
+                frame = item.frame
+                raw_frame = item.raw_frame
+                frame_idx = item.frame_idx
+
+                # Re-check da cama se necessario, avaliado a cada BED_DETECT_EVERY_N_FRAMES
+                # (ignorado em modo DEV_SKIP_BED_DETECTION)
+                if (not DEV_SKIP_BED_DETECTION
+                        and frame_idx - last_bed_check_idx >= BED_DETECT_EVERY_N_FRAMES):
+                    last_bed_check_idx = frame_idx
+                    if bed_detector.needs_recheck():
+                        result = bed_detector.detect_bed_detailed(frame, raw_frame=raw_frame)
+                        if result is not None:
+                            new_bbox, class_name, confidence, score = result
+                            current_score = bed_detector.detected_score
+                            if (bed_detector.is_bbox_consistent(new_bbox) and
+                                    score >= current_score):
+                                bed_detector._accept_detection(new_bbox, class_name, confidence, score)
+                                bed_bbox = new_bbox
+                                bed_detector.save_reference(bed_bbox)
+                                pose_analyzer.update_bed_bbox(bed_bbox)
+                                monitor.update_bed_bbox(bed_bbox)
+                                logger.info(f"Cama re-detectada: {bed_bbox} (score={score:.3f})")
+                            else:
+                                bed_detector.postpone_recheck()
+                                if not bed_detector.is_bbox_consistent(new_bbox):
+                                    logger.info(f"Recheck ignorado: bbox inconsistente (IoU baixo)")
+                                else:
+                                    logger.info(f"Recheck ignorado: score inferior ({score:.3f} < {current_score:.3f})")
                         else:
-                            logger.info(f"Recheck ignorado: score inferior ({score:.3f} < {current_score:.3f})")
-                else:
-                    bed_detector.postpone_recheck()
-
-            # Detecta pose com YOLOv8-Pose
-            results = yolo_pose.predict(frame, conf=YOLO_POSE_CONFIDENCE, verbose=False)
-
-            body_points = None
-            analysis = None
-            person_count = 0
-            person_bbox = None
-
-            # Verifica se detectou pessoa com keypoints
-            if len(results) > 0 and results[0].keypoints is not None:
-                keypoints_data = results[0].keypoints
-
-                if keypoints_data.xy is not None and len(keypoints_data.xy) > 0:
-                    # Filtra deteccoes duplicadas (bboxes sobrepostas da mesma pessoa)
-                    raw_count = len(keypoints_data.xy)
-                    if raw_count > 1 and results[0].boxes is not None and len(results[0].boxes) >= raw_count:
-                        boxes_xyxy = results[0].boxes.xyxy.cpu().numpy()
-                        keep = _filter_overlapping_boxes(boxes_xyxy, iou_threshold=0.4)
-                        person_count = len(keep)
-                    else:
-                        person_count = raw_count
-
-                    if person_count == 1:
-                        keypoints = keypoints_data.xy[0].cpu().numpy()
-
-                        if keypoints_data.conf is not None and len(keypoints_data.conf) > 0:
-                            confidences = keypoints_data.conf[0].cpu().numpy()
+                            bed_detector.postpone_recheck()
+
+                # Pose inferido pelo pipeline a cada POSE_EVERY_N_FRAMES; nos demais
+                # reaproveita o ultimo resultado
+                if item.inferred:
+                    body_points, analysis, person_count = _analyze_pose(pose_analyzer, item.detections)
+
+                    # Atualiza maquina de estados de pose
+                    pose_state = pose_fsm.update(analysis, body_points, person_count)
+
+                    # Atualiza monitor
+                    monitor.update(person_count)
+                pose_state_enum = PatientPoseState(pose_state)
+
+                # --- Renderizacao ---
+                # Em headless so anota quando o frame vira evidencia (mudanca de estado)
+                state_changed = pose_state != previous_pose_state
+                if display.should_draw() or state_changed:
+                    # draw_* sao no-op em headless; force_rendering libera a anotacao da evidencia
+                    with display.force_rendering(state_changed):
+                        frame = display.draw_bed_polygon(frame, bed_bbox)
+
+                        if body_points:
+                            frame = display.draw_keypoints(frame, body_points, pose_state_enum, bed_bbox)
+
+                        frame = display.draw_pose_state_message(frame, pose_state_enum)
+
+                        status = monitor.get_status()
+                        if pose_state_enum == PatientPoseState.ACOMPANHADO:
+                            status_text = f"STATUS: {status} | PESSOAS: {person_count} (acompanhado)"
+                        elif pose_state_enum == PatientPoseState.PACIENTE_FORA:
+                            status_text = f"STATUS: {status} | POSE: {pose_state_enum.value} - ALERTA CRITICO!"
+                        elif pose_state_enum == PatientPoseState.RISCO_POTENCIAL:
+                            status_text = f"STATUS: {status} | POSE: {pose_state_enum.value} - ATENCAO!"
                         else:
-                            confidences = np.ones(len(keypoints))
-
-                        confidences = pose_analyzer.smooth_confidences(confidences)
-
-                        # Extrai bbox da pessoa do resultado YOLO-Pose
-                        if results[0].boxes is not None and len(results[0].boxes) > 0:
-                            person_bbox = tuple(results[0].boxes.xyxy[0].cpu().numpy().astype(int))
-
-                        body_points = pose_analyzer.extract_body_points(keypoints, confidences)
-                        analysis = pose_analyzer.analyze_position(body_points, person_bbox)
+                            status_text = f"STATUS: {status} | POSE: {pose_state_enum.value}"
 
-            # Atualiza maquina de estados de pose
-            pose_state = pose_fsm.update(analysis, body_points, person_count)
-            pose_state_enum = PatientPoseState(pose_state)
+                        frame = display.draw_status(frame, status_text)
+                        frame = display.draw_pose_dashboard(frame, body_points, pose_state_enum, analysis)
 
-            # Atualiza monitor
-            monitor.update(person_count)
+                        ema_scores = pose_fsm.get_scores()
+                        frame = display.draw_ema_scores(frame, ema_scores)
 
-            # --- Renderizacao ---
-            frame = display.draw_bed_polygon(frame, bed_bbox)
-
-            if body_points:
-                frame = display.draw_keypoints(frame, body_points, pose_state_enum, bed_bbox)
-
-            frame = display.draw_pose_state_message(frame, pose_state_enum)
-
-            status = monitor.get_status()
-            if pose_state_enum == PatientPoseState.ACOMPANHADO:
-                status_text = f"STATUS: {status} | PESSOAS: {person_count} (acompanhado)"
-            elif pose_state_enum == PatientPoseState.PACIENTE_FORA:
-                status_text = f"STATUS: {status} | POSE: {pose_state_enum.value} - ALERTA CRITICO!"
-            elif pose_state_enum == PatientPoseState.RISCO_POTENCIAL:
-                status_text = f"STATUS: {status} | POSE: {pose_state_enum.value} - ATENCAO!"
-            else:
-                status_text = f"STATUS: {status} | POSE: {pose_state_enum.value}"
-
-            frame = display.draw_status(frame, status_text)
-            frame = display.draw_pose_dashboard(frame, body_points, pose_state_enum, analysis)
-
-            ema_scores = pose_fsm.get_scores()
-            frame = display.draw_ema_scores(frame, ema_scores)
-
-            # Detecta mudanca de estado e loga alertas
-            if pose_state != previous_pose_state:
-                image_path = alert_logger.log_state_change(
-                    previous_state=previous_pose_state,
-                    new_state=pose_state,
-                    frame=frame,  # Frame ja tem anotacoes
-                )
-                if image_path:
-                    last_alert_image = image_path
-                    alert_feedback_until = time.time() + 3.0
-                    print(f"[ALERTA] {pose_state} - Imagem salva: {image_path}")
-                elif pose_state in [PoseStateMachineEMA.RISCO_POTENCIAL, PoseStateMachineEMA.PACIENTE_FORA]:
-                    print(f"[ALERTA] {pose_state}")
-
-                previous_pose_state = pose_state
-
-            # Controle de alerta GPIO (fora do bloco de mudança de estado)
-            # Chamado a cada frame para manter o re-trigger ativo enquanto o alerta persistir
-            if pose_state in [PoseStateMachineEMA.RISCO_POTENCIAL, PoseStateMachineEMA.PACIENTE_FORA]:
-                gpio_manager.start_risk_alert()
-            else:
-                gpio_manager.stop_risk_alert()
+                # Detecta mudanca de estado e loga alertas
+                if state_changed:
+                    image_path = alert_logger.log_state_change(
+                        previous_state=previous_pose_state,
+                        new_state=pose_state,
+                        frame=frame,  # Frame ja tem anotacoes
+                    )
+                    if image_path:
+                        last_alert_image = image_path
+                        alert_feedback_until = time.time() + 3.0
+                        print(f"[ALERTA] {pose_state} - Imagem salva: {image_path}")
+                    elif pose_state in [PoseStateMachineEMA.RISCO_POTENCIAL, PoseStateMachineEMA.PACIENTE_FORA]:
+                        print(f"[ALERTA] {pose_state}")
+
+                    previous_pose_state = pose_state
+
+                # Controle de alerta GPIO (fora do bloco de mudança de estado)
+                # Chamado a cada frame para manter o re-trigger ativo enquanto o alerta persistir
+                if pose_state in [PoseStateMachineEMA.RISCO_POTENCIAL, PoseStateMachineEMA.PACIENTE_FORA]:
+                    gpio_manager.start_risk_alert()
+                else:
+                    gpio_manager.stop_risk_alert()
 
-            # Feedback visual de alerta salvo
-            if time.time() < alert_feedback_until and last_alert_image:
-                frame = display.draw_log_feedback(
-                    frame,
-                    f"Alerta #{alert_logger.get_alert_count()}",
-                    alert_logger.get_image_count(),
-                )
+                # Feedback visual de alerta salvo
+                if display.should_draw() and time.time() < alert_feedback_until and last_alert_image:
+                    frame = display.draw_log_feedback(
+                        frame,
+                        f"Alerta #{alert_logger.get_alert_count()}",
+                        alert_logger.get_image_count(),
+                    )
 
-            # Renderiza frame no display
-            key = display.render(frame)
+                # Renderiza frame no display (sem janela nao ha o que exibir
+                # nem teclas; a cadencia ja vem do pipeline)
+                key = display.render(frame) if not display.headless else -1
 
-            # Captura de teclas
-            if key == ord("q") or key == ord("Q"):
-                return True  # Encerramento normal
+                # Captura de teclas
+                if key in _QUIT_KEYS:
+                    return True  # Encerramento normal
 
-            if key == ord("r") or key == ord("R"):
-                pose_fsm.reset()
-                pose_analyzer.reset_confidence_ema()
-                logger.info("Maquina de estados resetada")
+                if key in _RESET_KEYS:
+                    pose_fsm.reset()
+                    pose_analyzer.reset_confidence_ema()
+                    logger.info("Maquina de estados resetada")
 
-            # Frame processado com sucesso — reset contador de erros de processamento
-            consecutive_processing_errors = 0
+                # Frame processado com sucesso — reset contador de erros de processamento
+                consecutive_processing_errors = 0
 
-            # Sleep adaptativo: só dorme o necessário para atingir o ciclo alvo
-            elapsed = time.time() - frame_start
-            remaining = FRAME_DELAY_SECONDS - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
+            except KeyboardInterrupt:
+                logger.info("Interrompido pelo usuario (Ctrl+C)")
+                return True
 
-        except KeyboardInterrupt:
-            logger.info("Interrompido pelo usuario (Ctrl+C)")
-            return True
+            except Exception as e:
+                consecutive_processing_errors += 1
+                log_exception(f"Erro de processamento ({consecutive_processing_errors}/{MAX_CONSECUTIVE_ERRORS})", e)
 
-        except Exception as e:
-            consecutive_processing_errors += 1
-            log_exception(f"Erro de processamento ({consecutive_processing_errors}/{MAX_CONSECUTIVE_ERRORS})", e)
+                if consecutive_processing_errors >= MAX_CONSECUTIVE_ERRORS:
+                    logger.error("Muitos erros de processamento consecutivos - reiniciando sistema")
+                    return False
 
-            if consecutive_processing_errors >= MAX_CONSECUTIVE_ERRORS:
-                logger.error("Muitos erros de processamento consecutivos - reiniciando sistema")
-                return False
+                time.sleep(ERROR_RECOVERY_DELAY)
 
-            time.sleep(ERROR_RECOVERY_DELAY)
+    finally:
+        pipeline.stop()
 
 
 def main():
@@ -886,8 +1016,6 @@ def main():
                 else:
                     ret, frame = camera.read()
                     if ret and frame is not None:
-                        if FLIP_HORIZONTAL:
-                            frame = cv2.flip(frame, 1)
                         frame = normalize_frame_for_ir(frame)
                         frame = display.draw_system_message(
                             frame,
@@ -901,11 +1029,11 @@ def main():
 
             # Exibe mensagem de sucesso
             config_complete_time = time.time()
+            pacer = FramePacer()
             while time.time() - config_complete_time < CALIBRATION_SUCCESS_DISPLAY_SECONDS:
+                pacer.wait()
                 ret, frame = camera.read()
                 if ret and frame is not None:
-                    if FLIP_HORIZONTAL:
-                        frame = cv2.flip(frame, 1)
                     frame = normalize_frame_for_ir(frame)
                     frame = display.draw_bed_polygon(frame, bed_bbox)
                     frame = display.draw_system_message(
@@ -916,13 +1044,11 @@ def main():
                     )
                     key = display.render(frame)
 
-                    if key == ord("q") or key == ord("Q"):
+                    if key in _QUIT_KEYS:
                         logger.info("Encerrado pelo usuario durante inicializacao")
-                        safe_cleanup(camera, display, gpio_manager)
+                        safe_cleanup(camera, display, gpio_manager, alert_logger)
                         return
 
-                time.sleep(FRAME_DELAY_SECONDS)
-
             # Ativa indicador de sistema pronto (GPIO)
             gpio_manager.set_system_ready(True)
 
@@ -938,10 +1064,11 @@ def main():
                 if DEV_MODE:
                     print(f"Imagens de alerta salvas: {alert_logger.get_image_count()}")
 
-            safe_cleanup(camera, display, gpio_manager)
+            safe_cleanup(camera, display, gpio_manager, alert_logger)
             camera = None
             display = None
             gpio_manager = None
+            alert_logger = None
 
             if user_requested_exit:
                 logger.info("Encerramento normal solicitado pelo usuario")
@@ -959,10 +1086,11 @@ def main():
 
         except Exception as e:
             log_exception("Erro fatal na inicializacao", e)
-            safe_cleanup(camera, display, gpio_manager)
+            safe_cleanup(camera, display, gpio_manager, alert_logger)
             camera = None
             display = None
             gpio_manager = None
+            alert_logger = None
 
             # Continua tentando indefinidamente
             # O watchdog de hardware reiniciará o sistema se necessário
@@ -975,7 +1103,7 @@ def main():
             time.sleep(INIT_RETRY_DELAY)
 
     # Cleanup final
-    safe_cleanup(camera, display, gpio_manager)
+    safe_cleanup(camera, display, gpio_manager, alert_logger)
     print("\nMonitoramento de pose encerrado.")
 
 
@@ -10,8 +10,11 @@ Formato do log:
 
 import logging
 import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -19,14 +22,31 @@ import cv2
 import numpy as np
 
 from config import (
+    ALERT_IMAGE_ASYNC_WRITE,
+    ALERT_IMAGE_QUEUE_SIZE,
     ALERT_IMAGES_DIR,
+    ALERT_JPEG_QUALITY,
     ALERT_LOG_PATH,
     ALERT_LOG_RETENTION_DAYS,
     DEV_MODE,
+    LOG_ASYNC_QUEUE_SIZE,
+    LOG_LEVEL,
+    LOG_USE_QUEUE_HANDLER,
     MAX_ALERT_IMAGES,
 )
 from modules.environment import get_environment_config
 
+# Estados que geram alerta (e imagem de evidencia)
+_ALERT_STATES = frozenset(("RISCO_POTENCIAL", "PACIENTE_FORA"))
+
+# Parametros do encode JPEG das evidencias: baseline, sem passada extra de
+# otimizacao de Huffman (mais rapido no Pi; tamanho quase igual)
+_JPEG_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, ALERT_JPEG_QUALITY,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+]
+
 
 class AlertLogger:
     """Gerenciador de logs de alertas e imagens de evidencia."""
@@ -54,6 +74,10 @@ class AlertLogger:
         self.max_images = max_images
         self.dev_mode = dev_mode
         self._retention_days = retention_days
+        self._listener: Optional[QueueListener] = None
+        self._image_queue: Optional[queue.Queue] = None
+        self._image_writer: Optional[threading.Thread] = None
+        self.dropped_images = 0
 
         # Carrega configuracao do ambiente
         env_config = get_environment_config()
@@ -65,12 +89,24 @@ class AlertLogger:
         # Cria diretorios se nao existem
         self._ensure_directories()
 
+        # Imagens retidas, da mais antiga para a mais recente (lista o diretorio
+        # uma unica vez; depois a retencao eh O(1) por alerta)
+        self._saved_images: deque = deque(self._list_existing_images())
+
         # Configura logger rotacionado por tempo
         self.logger = self._setup_logger(retention_days)
 
         # Limpeza de backups antigos na inicializacao
         self._cleanup_old_logs()
 
+        # Thread de escrita das imagens de evidencia (JPEG fora do loop principal)
+        if self.dev_mode and ALERT_IMAGE_ASYNC_WRITE:
+            self._image_queue = queue.Queue(ALERT_IMAGE_QUEUE_SIZE)
+            self._image_writer = threading.Thread(
+                target=self._image_writer_loop, name="AlertImageWriter", daemon=True
+            )
+            self._image_writer.start()
+
         # Contador de alertas
         self.alert_count = 0
 
@@ -96,7 +132,7 @@ class AlertLogger:
             Logger configurado
         """
         logger = logging.getLogger("AlertLogger")
-        logger.setLevel(logging.INFO)
+        logger.setLevel(LOG_LEVEL)
 
         # Remove handlers existentes para evitar duplicacao
         logger.handlers.clear()
@@ -119,10 +155,32 @@ class AlertLogger:
         )
         handler.setFormatter(formatter)
 
-        logger.addHandler(handler)
+        if LOG_USE_QUEUE_HANDLER:
+            # Escrita em disco feita pela thread do QueueListener
+            log_queue: queue.Queue = queue.Queue(LOG_ASYNC_QUEUE_SIZE)
+            self._listener = QueueListener(log_queue, handler)
+            self._listener.start()
+            logger.addHandler(QueueHandler(log_queue))
+        else:
+            logger.addHandler(handler)
 
         return logger
 
+    def close(self) -> None:
+        """Descarrega registros/imagens pendentes e encerra as threads de escrita."""
+        if self._image_writer is not None:
+            # Sentinela: o writer termina depois de gravar o que ja esta na fila
+            self._image_queue.put(None)
+            self._image_writer.join(timeout=5.0)
+            self._image_writer = None
+            self._image_queue = None
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in self.logger.handlers:
+            handler.close()
+        self.logger.handlers.clear()
+
     def _cleanup_old_logs(self) -> None:
         """Remove log backups older than retention period on startup."""
         import re
@@ -141,11 +199,11 @@ class AlertLogger:
                     file_date = datetime.strptime(suffix, "%Y-%m-%d")
                     if file_date < cutoff_date:
                         backup_file.unlink()
-                        self.logger.info(f"SISTEMA | LOG_CLEANUP | Removed old log: {backup_file.name}")
+                        self.logger.info("SISTEMA | LOG_CLEANUP | Removed old log: %s", backup_file.name)
                 except ValueError:
                     continue
         except Exception as e:
-            self.logger.error(f"SISTEMA | LOG_CLEANUP_ERROR | {e}")
+            self.logger.error("SISTEMA | LOG_CLEANUP_ERROR | %s", e)
 
     def log_alert(
         self,
@@ -165,23 +223,21 @@ class AlertLogger:
             Caminho da imagem salva ou string vazia se nao salvou
         """
         self.alert_count += 1
-        timestamp = datetime.now()
 
-        # Monta mensagem de log estruturada
+        # Registra no log (formatacao adiada pelo logging)
         # Formato: ALERTA | ESTADO | Detalhes
-        message = f"ALERTA | {pose_state}"
         if details:
-            message += f" | {details}"
-
-        # Registra no log
-        self.logger.warning(message)
+            self.logger.warning("ALERTA | %s | %s", pose_state, details)
+        else:
+            self.logger.warning("ALERTA | %s", pose_state)
 
         # Salva imagem se em modo dev e frame fornecido
         image_path = ""
         if self.dev_mode and frame is not None:
-            image_path = self._save_alert_image(frame, pose_state, timestamp)
+            # Data/hora so e necessaria para o nome da imagem
+            image_path = self._save_alert_image(frame, pose_state, datetime.now())
             if image_path:
-                self.logger.info(f"SISTEMA | IMAGEM_SALVA | {image_path}")
+                self.logger.info("SISTEMA | IMAGEM_SALVA | %s", image_path)
 
         return image_path
 
@@ -202,22 +258,19 @@ class AlertLogger:
         Returns:
             Caminho da imagem salva ou string vazia
         """
-        details = f"Transicao: {previous_state} -> {new_state}"
-
         # Determina se eh um alerta
-        alert_states = ["RISCO_POTENCIAL", "PACIENTE_FORA"]
-
-        if new_state in alert_states:
+        if new_state in _ALERT_STATES:
+            details = f"Transicao: {previous_state} -> {new_state}"
             return self.log_alert(new_state, frame, details)
         else:
             # Loga transicao normal
             # Formato: TRANSICAO | NOVO_ESTADO | Detalhes
-            self.logger.info(f"TRANSICAO | {new_state} | {details}")
+            self.logger.info("TRANSICAO | %s | Transicao: %s -> %s", new_state, previous_state, new_state)
             return ""
 
     def log_info(self, message: str) -> None:
         """Registra mensagem informativa no log."""
-        self.logger.info(f"SISTEMA | INFO | {message}")
+        self.logger.info("SISTEMA | INFO | %s", message)
 
     def get_environment_id(self) -> str:
         """Retorna ID do ambiente configurado."""
@@ -240,9 +293,6 @@ class AlertLogger:
         Returns:
             Caminho da imagem salva ou string vazia se falhou
         """
-        # Garante que diretorio existe
-        Path(self.images_dir).mkdir(parents=True, exist_ok=True)
-
         # Aplica retencao antes de salvar
         self._apply_retention()
 
@@ -251,38 +301,105 @@ class AlertLogger:
         filename = f"alert_{timestamp_str}_{pose_state}.jpg"
         filepath = os.path.join(self.images_dir, filename)
 
-        # Salva imagem
+        # Salva imagem (na thread de escrita, se ativa)
         try:
-            cv2.imwrite(filepath, frame)
+            if self._image_queue is not None:
+                # Copia: o chamador reaproveita o buffer do frame no proximo ciclo
+                try:
+                    self._image_queue.put_nowait((filepath, frame.copy()))
+                except queue.Full:
+                    self.dropped_images += 1
+                    self.logger.warning("SISTEMA | IMAGEM_DESCARTADA | Fila cheia: %s", filename)
+                    return ""
+            else:
+                self._write_image(filepath, frame)
+            # Nomes sao unicos por milissegundo; so o ultimo pode coincidir
+            path = Path(filepath)
+            if not self._saved_images or self._saved_images[-1] != path:
+                self._saved_images.append(path)
             return filepath
         except Exception as e:
-            self.logger.error(f"Erro ao salvar imagem: {e}")
+            self.logger.error("Erro ao salvar imagem: %s", e)
             return ""
 
-    def _apply_retention(self) -> None:
+    @staticmethod
+    def _write_image(filepath: str, frame: np.ndarray) -> bool:
         """
-        Aplica politica de retencao de imagens.
+        Codifica e grava a imagem JPEG.
 
-        Remove imagens mais antigas se exceder o limite maximo.
+        O diretorio e criado no __init__; so e recriado se a escrita falhar
+        porque ele foi removido externamente.
         """
-        try:
-            images_path = Path(self.images_dir)
+        if cv2.imwrite(filepath, frame, _JPEG_PARAMS):
+            return True
+        images_dir = os.path.dirname(filepath)
+        if images_dir and not os.path.isdir(images_dir):
+            os.makedirs(images_dir, exist_ok=True)
+            return cv2.imwrite(filepath, frame, _JPEG_PARAMS)
+        return False
+
+    def _image_writer_loop(self) -> None:
+        """Loop da thread de escrita: grava imagens da fila ate receber a sentinela."""
+        while True:
+            item = self._image_queue.get()
+            if item is None:
+                break
+            filepath, frame = item
+            try:
+                if not self._write_image(filepath, frame):
+                    self.logger.error("Erro ao salvar imagem: %s", filepath)
+            except Exception as e:
+                self.logger.error("Erro ao salvar imagem: %s", e)
+
+    def _list_existing_images(self) -> list:
+        """
+        Lista imagens de alerta existentes em ordem cronologica.
 
-            # Lista imagens existentes ordenadas por data de modificacao
-            images = sorted(
-                images_path.glob("alert_*.jpg"),
-                key=lambda x: x.stat().st_mtime,
-            )
+        O nome (alert_AAAAMMDD_HHMMSS_mmm_ESTADO.jpg) ja ordena por data,
+        entao dispensa um stat por arquivo.
 
-            # Remove imagens mais antigas se exceder limite
-            # (max_images - 1 para dar espaco para a nova imagem)
-            while len(images) >= self.max_images:
-                oldest = images.pop(0)
-                oldest.unlink()
-                self.logger.info(f"Imagem removida por retencao: {oldest.name}")
+        Returns:
+            Lista de Paths, da mais antiga para a mais recente
+        """
+        try:
+            # scandir: um readdir, sem fnmatch/lstat por entrada
+            with os.scandir(self.images_dir) as entries:
+                names = sorted(
+                    entry.name for entry in entries
+                    if entry.name.startswith("alert_") and entry.name.endswith(".jpg")
+                )
+            return [Path(self.images_dir, name) for name in names]
+        except Exception:
+            return []
 
-        except Exception as e:
-            self.logger.error(f"Erro ao aplicar retencao: {e}")
+    def _apply_retention(self) -> None:
+        """
+        Aplica politica de retencao de imagens.
+
+        Remove imagens mais antigas se exceder o limite maximo, numa unica
+        passada e com uma linha de log por lote. Uma imagem que falha ao ser
+        removida continua na lista e e tentada de novo na proxima chamada.
+        """
+        # (max_images - 1 para dar espaco para a nova imagem)
+        overflow = min(len(self._saved_images), len(self._saved_images) - (self.max_images - 1))
+        if overflow <= 0:
+            return
+
+        removed = 0
+        idx = 0  # Imagens que falharam ficam na frente da fila
+        for _ in range(overflow):
+            path = self._saved_images[idx]
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.error("Erro ao aplicar retencao: %s (%s)", path, e)
+                idx += 1
+                continue
+            del self._saved_images[idx]
+            removed += 1
+
+        if removed:
+            self.logger.info("Retencao: %d imagem(ns) removida(s)", removed)
 
     def get_alert_count(self) -> int:
         """Retorna contagem de alertas registrados."""
@@ -290,8 +407,4 @@ class AlertLogger:
 
     def get_image_count(self) -> int:
         """Retorna quantidade de imagens no diretorio."""
-        try:
-            images_path = Path(self.images_dir)
-            return len(list(images_path.glob("alert_*.jpg")))
-        except Exception:
-            return 0
+        return len(self._saved_images)
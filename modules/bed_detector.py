@@ -11,8 +11,9 @@ Estratégias de detecção (em ordem de prioridade):
 import json
 import os
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Dict, Iterator, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -30,10 +31,16 @@ from config import (
     BED_DETECTION_CONF_SECONDARY,
     BED_DETECTION_DIAGNOSTIC,
     BED_DETECTION_SENSITIVITY,
+    BED_FREEZE_AFTER_CALIBRATION,
     BED_MAX_AREA_RATIO,
     BED_MIN_AREA_RATIO,
+    BED_MODEL_WARMUP,
     BED_RECHECK_INTERVAL_HOURS,
     BED_REFERENCE_PATH,
+    BED_REFERENCE_PATH_JSON,
+    CAPTURE_HEIGHT,
+    CAPTURE_WIDTH,
+    PREDICT_KWARGS_BED,
 )
 
 
@@ -51,6 +58,30 @@ def preprocess_ir_histeq(frame: np.ndarray) -> np.ndarray:
     return cv2.cvtColor(cv2.equalizeHist(gray), cv2.COLOR_GRAY2BGR)
 
 
+@contextmanager
+def _atomic_open(path: Path, mode: str) -> Iterator[IO]:
+    """
+    Abre um arquivo temporário ao lado de path e o renomeia sobre path ao final.
+
+    Uma queda de energia no meio da escrita deixa a referência anterior
+    intacta (os.replace é atômico no mesmo sistema de arquivos).
+
+    Args:
+        path: Arquivo de destino.
+        mode: "w" ou "wb".
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class BedDetector:
     """Detector de cama hospitalar usando YOLOv8 com múltiplas estratégias."""
 
@@ -67,23 +98,50 @@ class BedDetector:
         self.bed_bbox: Optional[Tuple[int, int, int, int]] = None
         self.last_detection_time: Optional[float] = None
         self.reference_path = Path(BED_REFERENCE_PATH)
+        self.reference_json_path = Path(BED_REFERENCE_PATH_JSON)
+        # Ultimo registro gravado ou lido do disco (evita regravar referencia identica)
+        self._last_saved_record: Optional[dict] = None
         self.detected_class_name: Optional[str] = None
         self.detected_strategy: Optional[str] = None
         self.detected_confidence: float = 0.0
         self.detected_score: float = 0.0
 
+        # Mapa nome -> índice do modelo COCO, montado uma vez
+        self._class_index: Dict[str, int] = {
+            name.lower(): idx for idx, name in yolo_model.names.items()
+        }
+
         # Resolve nomes de classes para índices (legado, para recheck)
         self.bed_class_indices = self._resolve_class_names(BED_CLASS_NAMES)
 
         # Constrói estratégias de detecção
         self.strategies = self._build_strategies()
 
+        if BED_MODEL_WARMUP:
+            self._warmup()
+
         # Tenta carregar referência salva
         self.load_reference()
 
+    def _warmup(self) -> None:
+        """
+        Roda uma inferência descartável para o custo da primeira chamada
+        (criação do predictor, fusão de camadas, alocações) ficar na inicialização.
+        """
+        if not self.bed_class_indices:
+            return
+        dummy = np.zeros((CAPTURE_HEIGHT, CAPTURE_WIDTH, 3), dtype=np.uint8)
+        try:
+            next(self.model.predict(dummy, classes=self.bed_class_indices, **PREDICT_KWARGS_BED), None)
+        except Exception as e:
+            # Aquecimento é opcional: a primeira detecção real paga o custo
+            print(f"[BedDetector] Aquecimento do modelo falhou: {e}")
+
     def _resolve_class_names(self, class_names: list) -> list:
         """Resolve nomes de classes para índices usando model.names (COCO)."""
-        return self._resolve_class_names_for_model(self.model, class_names)
+        found = {self._class_index.get(n.lower()) for n in class_names}
+        found.discard(None)
+        return sorted(found)
 
     @staticmethod
     def _resolve_class_names_for_model(model, class_names: list) -> list:
@@ -98,7 +156,7 @@ class BedDetector:
             Lista de índices correspondentes aos nomes fornecidos.
         """
         indices = []
-        target_names = [n.lower() for n in class_names]
+        target_names = {n.lower() for n in class_names}
 
         for idx, name in model.names.items():
             if name.lower() in target_names:
@@ -126,9 +184,14 @@ class BedDetector:
         """
         strategies = []
 
+        # IDs de classe resolvidos uma única vez no carregamento do modelo;
+        # predict(classes=...) filtra as demais classes já no NMS
+        primary_indices = self._resolve_class_names(BED_CLASS_NAMES_PRIMARY)
+        secondary_indices = self._resolve_class_names(BED_CLASS_NAMES_SECONDARY)
+
         # Estratégia 0: COCO histEq no frame cru (melhor bbox para IR)
         # HistEq elimina color cast IR e COCO dá bbox preciso (~40% frame)
-        histeq_indices = self._resolve_class_names(BED_CLASS_NAMES_SECONDARY)
+        histeq_indices = secondary_indices
         if histeq_indices:
             strategies.append({
                 "name": "coco_histEq",
@@ -141,7 +204,7 @@ class BedDetector:
             })
 
         # Estratégia 1: COCO no frame cru (fallback IR)
-        raw_indices = self._resolve_class_names(BED_CLASS_NAMES_SECONDARY)
+        raw_indices = secondary_indices
         if raw_indices:
             strategies.append({
                 "name": "coco_raw",
@@ -154,7 +217,6 @@ class BedDetector:
             })
 
         # Estratégia 2: Primary no frame normalizado (bed, couch)
-        primary_indices = self._resolve_class_names(BED_CLASS_NAMES_PRIMARY)
         if primary_indices:
             strategies.append({
                 "name": "primary",
@@ -165,7 +227,6 @@ class BedDetector:
             })
 
         # Estratégia 3: Secondary (bed, couch, bench)
-        secondary_indices = self._resolve_class_names(BED_CLASS_NAMES_SECONDARY)
         if secondary_indices:
             strategies.append({
                 "name": "secondary",
@@ -176,7 +237,7 @@ class BedDetector:
             })
 
         # Estratégia 4: Exploratory (conf baixa)
-        exploratory_indices = self._resolve_class_names(BED_CLASS_NAMES_SECONDARY)
+        exploratory_indices = secondary_indices
         if exploratory_indices:
             strategies.append({
                 "name": "exploratory",
@@ -220,120 +281,143 @@ class BedDetector:
         Returns:
             Score combinado (maior = melhor candidata).
         """
-        x1, y1, x2, y2 = bbox
-
-        # 1. Score de área - camas mais visíveis ocupam mais espaço
-        bed_area = (x2 - x1) * (y2 - y1)
-        frame_area = frame_width * frame_height
-        area_score = bed_area / frame_area  # Normalizado 0-1
-
-        # 2. Score de centralização - camas no centro do campo de visão
-        bed_center_x = (x1 + x2) / 2
-        bed_center_y = (y1 + y2) / 2
-        frame_center_x = frame_width / 2
-        frame_center_y = frame_height / 2
-
-        # Distância normalizada do centro (0 = centro perfeito, 1 = canto)
-        dist_x = abs(bed_center_x - frame_center_x) / (frame_width / 2)
-        dist_y = abs(bed_center_y - frame_center_y) / (frame_height / 2)
-        center_distance = (dist_x + dist_y) / 2
-        center_score = 1 - center_distance  # Invertido: mais perto do centro = maior score
-
-        # 3. Penalidade para camas cortadas nas bordas
-        edge_margin = 5  # pixels de margem para considerar "na borda"
-        edge_penalty = 0.0
-
-        if x1 <= edge_margin:  # Cortada na esquerda
-            edge_penalty += 0.3
-        if y1 <= edge_margin:  # Cortada em cima
-            edge_penalty += 0.3
-        if x2 >= frame_width - edge_margin:  # Cortada na direita
-            edge_penalty += 0.3
-        if y2 >= frame_height - edge_margin:  # Cortada embaixo
-            edge_penalty += 0.3
-
-        # Score final: combinação ponderada
-        final_score = (
+        scores = self._calculate_bed_scores(
+            np.asarray(bbox).reshape(1, 4), np.array([confidence]), frame_height, frame_width,
+        )
+        return float(scores[0])
+
+    @staticmethod
+    def _calculate_bed_scores(
+        xyxy: np.ndarray,
+        confidences: np.ndarray,
+        frame_height: int,
+        frame_width: int,
+    ) -> np.ndarray:
+        """
+        Calcula o score de _calculate_bed_score para todas as detecções de uma vez.
+
+        Pesos: área 0.45, centralização 0.30, confiança 0.25; penalidade de
+        0.3 por borda cortada (margem de 5 px).
+
+        Args:
+            xyxy: Array (N, 4) com coordenadas (x1, y1, x2, y2).
+            confidences: Array (N,) com scores de confiança do YOLO.
+            frame_height: Altura do frame.
+            frame_width: Largura do frame.
+
+        Returns:
+            Array (N,) com o score combinado de cada detecção.
+        """
+        xyxy = xyxy.astype(np.float64, copy=False)
+        x1, y1, x2, y2 = xyxy[:, 0], xyxy[:, 1], xyxy[:, 2], xyxy[:, 3]
+
+        # 1. Área normalizada
+        area_score = (x2 - x1) * (y2 - y1) / (frame_width * frame_height)
+
+        # 2. Centralização (0 = centro perfeito, 1 = canto), invertida
+        dist_x = np.abs((x1 + x2) / 2 - frame_width / 2) / (frame_width / 2)
+        dist_y = np.abs((y1 + y2) / 2 - frame_height / 2) / (frame_height / 2)
+        center_score = 1 - (dist_x + dist_y) / 2
+
+        # 3. Penalidade de 0.3 por borda cortada
+        edge_margin = 5
+        edges_cut = (
+            (x1 <= edge_margin).astype(np.float64)
+            + (y1 <= edge_margin)
+            + (x2 >= frame_width - edge_margin)
+            + (y2 >= frame_height - edge_margin)
+        )
+        edge_penalty = 0.3 * edges_cut
+
+        return (
             area_score * 0.45 +
             center_score * 0.30 +
-            confidence * 0.25
+            confidences * 0.25
         ) * (1 - edge_penalty)
 
-        return final_score
+    @staticmethod
+    def _boxes_to_numpy(boxes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Copia as detecções do YOLO para NumPy (uma transferência por tensor).
+
+        Args:
+            boxes: ultralytics Boxes de um resultado.
+
+        Returns:
+            Tuple (xyxy (N, 4), confianças (N,), ids de classe (N,)).
+        """
+        return (
+            boxes.xyxy.cpu().numpy(),
+            boxes.conf.cpu().numpy().astype(np.float64),
+            boxes.cls.cpu().numpy().astype(np.int64),
+        )
 
     def _select_best_detection(
         self,
-        boxes,
+        xyxy: np.ndarray,
+        confidences: np.ndarray,
+        class_ids: np.ndarray,
         frame_height: int,
         frame_width: int,
         model=None,
         max_area_ratio: float = BED_MAX_AREA_RATIO,
+        scores: Optional[np.ndarray] = None,
     ) -> Optional[Tuple[Tuple[int, int, int, int], str, float, float]]:
-        """Filtra por área mínima e seleciona a melhor detecção."""
+        """Filtra por área mínima e seleciona a melhor detecção (scores opcionais, já calculados)."""
         model = model or self.model
-        frame_area = frame_height * frame_width
-        best_score = -1
-        best_result = None
-
-        for i in range(len(boxes)):
-            bbox = boxes.xyxy[i].cpu().numpy()
-            confidence = float(boxes.conf[i])
-            x1, y1, x2, y2 = bbox
+        if len(xyxy) == 0:
+            return None
 
-            det_area = (x2 - x1) * (y2 - y1)
-            area_ratio = det_area / frame_area
-            if area_ratio < BED_MIN_AREA_RATIO:
-                continue
-            if area_ratio > max_area_ratio:
-                continue
-
-            score = self._calculate_bed_score(
-                bbox, frame_height, frame_width, confidence
-            )
+        area_ratio = (
+            (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+            / (frame_height * frame_width)
+        )
+        valid = (area_ratio >= BED_MIN_AREA_RATIO) & (area_ratio <= max_area_ratio)
+        if not valid.any():
+            return None
 
-            if score > best_score:
-                best_score = score
-                class_id = int(boxes.cls[i])
-                class_name = model.names[class_id]
-                best_result = (
-                    tuple(bbox.astype(int)),
-                    class_name,
-                    confidence,
-                    score,
-                )
+        if scores is None:
+            scores = self._calculate_bed_scores(xyxy, confidences, frame_height, frame_width)
+        best = int(np.argmax(np.where(valid, scores, -np.inf)))
 
-        return best_result
+        return (
+            tuple(xyxy[best].astype(int)),
+            model.names[int(class_ids[best])],
+            float(confidences[best]),
+            float(scores[best]),
+        )
 
     def _log_detections(
         self,
         strategy_name: str,
-        boxes,
+        xyxy: np.ndarray,
+        confidences: np.ndarray,
+        class_ids: np.ndarray,
         frame_height: int,
         frame_width: int,
         model=None,
+        scores: Optional[np.ndarray] = None,
     ) -> None:
-        """Loga detalhes de cada detecção para diagnóstico."""
+        """Loga detalhes de cada detecção para diagnóstico (scores opcionais, já calculados)."""
         model = model or self.model
         frame_area = frame_height * frame_width
 
-        if len(boxes) == 0:
+        if len(xyxy) == 0:
             print(f"    [{strategy_name}] Nenhuma deteccao")
             return
 
-        for i in range(len(boxes)):
-            bbox = boxes.xyxy[i].cpu().numpy()
-            confidence = float(boxes.conf[i])
-            class_id = int(boxes.cls[i])
+        if scores is None:
+            scores = self._calculate_bed_scores(xyxy, confidences, frame_height, frame_width)
+
+        for bbox, confidence, class_id, score in zip(
+            xyxy, confidences.tolist(), class_ids.tolist(), scores.tolist()
+        ):
             class_name = model.names[class_id]
 
             x1, y1, x2, y2 = bbox
             det_area = (x2 - x1) * (y2 - y1)
             area_pct = (det_area / frame_area) * 100
 
-            score = self._calculate_bed_score(
-                bbox, frame_height, frame_width, confidence
-            )
-
             bbox_str = f"({int(x1)},{int(y1)},{int(x2)},{int(y2)})"
             print(f"    [{strategy_name}] {class_name}: conf={confidence:.3f} "
                   f"bbox={bbox_str} area={area_pct:.1f}% score={score:.3f}")
@@ -350,11 +434,16 @@ class BedDetector:
         Args:
             frame: Frame normalizado (para COCO).
             raw_frame: Frame cru antes da normalização IR (para ASETO).
-            diagnostic: Se True, força log detalhado de todas as detecções.
+            diagnostic: Se True, força log detalhado de todas as detecções
+                e sempre roda a detecção (calibração).
 
         Returns:
             Tuple (x1, y1, x2, y2) com coordenadas da cama ou None se não detectada.
         """
+        # Referência válida e recheck não vencido: reaproveita sem rodar o YOLO
+        if not diagnostic and self.bed_bbox is not None and not self.needs_recheck():
+            return self.bed_bbox
+
         result = self.detect_bed_detailed(frame, raw_frame, diagnostic)
         if result is None:
             return None
@@ -385,37 +474,73 @@ class BedDetector:
         frame_height, frame_width = frame.shape[:2]
         do_log = diagnostic or BED_DETECTION_DIAGNOSTIC
 
-        for strategy in self.strategies:
-            model = strategy.get("model", self.model)
+        # Estrategias com o mesmo modelo e a mesma entrada compartilham um unico
+        # predict (conf minima e uniao das classes do grupo); cada estrategia
+        # so filtra o resultado. predict roda sob demanda, preservando o
+        # retorno antecipado na primeira estrategia que encontra a cama.
+        def input_kind(strategy: Dict) -> Optional[str]:
             preprocess = strategy.get("preprocess")
+            return preprocess if raw_frame is not None else None
 
-            if preprocess == "histeq" and raw_frame is not None:
-                input_frame = preprocess_ir_histeq(raw_frame)
-            elif preprocess == "raw" and raw_frame is not None:
-                input_frame = raw_frame
-            elif preprocess == "clahe_agr" and raw_frame is not None:
-                input_frame = preprocess_ir_for_aseto(raw_frame)
-            else:
-                input_frame = frame
-
-            results = model.predict(
-                input_frame,
-                classes=strategy["class_indices"],
-                conf=strategy["conf"],
-                verbose=False,
-            )
+        groups: Dict[tuple, Tuple[float, set]] = {}
+        for strategy in self.strategies:
+            key = (id(strategy.get("model", self.model)), input_kind(strategy))
+            conf, classes = groups.get(key, (1.0, set()))
+            groups[key] = (min(conf, strategy["conf"]), classes | set(strategy["class_indices"]))
 
-            has_detections = (
-                len(results) > 0 and len(results[0].boxes) > 0
-            )
+        predictions: Dict[tuple, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        for strategy in self.strategies:
+            model = strategy.get("model", self.model)
+            kind = input_kind(strategy)
+            key = (id(model), kind)
+
+            if key not in predictions:
+                if kind == "histeq":
+                    input_frame = preprocess_ir_histeq(raw_frame)
+                elif kind == "raw":
+                    input_frame = raw_frame
+                elif kind == "clahe_agr":
+                    input_frame = preprocess_ir_for_aseto(raw_frame)
+                else:
+                    input_frame = frame
+
+                group_conf, group_classes = groups[key]
+                result = next(model.predict(
+                    input_frame,
+                    classes=sorted(group_classes),
+                    conf=group_conf,
+                    **PREDICT_KWARGS_BED,
+                ), None)
+                if result is not None and len(result.boxes) > 0:
+                    predictions[key] = self._boxes_to_numpy(result.boxes)
+                else:
+                    predictions[key] = (
+                        np.empty((0, 4), dtype=np.float32),
+                        np.empty(0, dtype=np.float64),
+                        np.empty(0, dtype=np.int64),
+                    )
+
+            # Deteccoes desta estrategia: suas classes e seu threshold (estrito,
+            # como o filtro de conf do NMS do ultralytics)
+            xyxy, confidences, class_ids = predictions[key]
+            mask = (confidences > strategy["conf"]) & np.isin(class_ids, strategy["class_indices"])
+            xyxy, confidences, class_ids = xyxy[mask], confidences[mask], class_ids[mask]
+            has_detections = len(xyxy) > 0
+
+            # Scores calculados uma vez, usados pelo log e pela selecao
+            scores = None
+            if has_detections:
+                scores = self._calculate_bed_scores(xyxy, confidences, frame_height, frame_width)
 
             if do_log and has_detections:
                 self._log_detections(
                     strategy["name"],
-                    results[0].boxes,
+                    xyxy, confidences, class_ids,
                     frame_height,
                     frame_width,
                     model=model,
+                    scores=scores,
                 )
             elif do_log and not has_detections:
                 print(f"    [{strategy['name']}] Nenhuma deteccao")
@@ -423,8 +548,8 @@ class BedDetector:
             if has_detections and strategy["returns_detection"]:
                 max_area = strategy.get("max_area_ratio", BED_MAX_AREA_RATIO)
                 best = self._select_best_detection(
-                    results[0].boxes, frame_height, frame_width,
-                    model=model, max_area_ratio=max_area,
+                    xyxy, confidences, class_ids, frame_height, frame_width,
+                    model=model, max_area_ratio=max_area, scores=scores,
                 )
                 if best is not None:
                     bbox, class_name, confidence, score = best
@@ -454,41 +579,96 @@ class BedDetector:
 
     def save_reference(self, bbox: Tuple[int, int, int, int]) -> None:
         """
-        Persiste coordenadas da cama em arquivo JSON com metadados.
+        Persiste coordenadas da cama em .npz (e cópia JSON legível) com metadados.
+
+        Se o registro (bbox, metadados e horário da detecção) for igual ao
+        último gravado, não reescreve (poupa escritas no cartão SD quando a
+        mesma detecção é salva mais de uma vez).
 
         Args:
             bbox: Tuple (x1, y1, x2, y2) com coordenadas.
         """
-        self.reference_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Converte numpy int64 para int nativo Python
+        bbox_ints = tuple(int(v) for v in bbox)
+        # Horário da detecção aceita (_accept_detection); o restart restaura o mesmo valor
+        timestamp = self.last_detection_time if self.last_detection_time is not None else time.time()
+
         data = {
-            "bbox": [int(v) for v in bbox],
-            "timestamp": time.time(),
+            "bbox": list(bbox_ints),
+            "timestamp": float(timestamp),
             "detected_class": self.detected_class_name,
             "detected_strategy": self.detected_strategy,
             "confidence": float(self.detected_confidence),
             "score": float(self.detected_score),
         }
+        if data == self._last_saved_record and self.reference_path.exists():
+            self.bed_bbox = bbox
+            return
+
+        self.reference_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.reference_path, "w") as f:
+        # np.savez acrescenta .npz se ausente; abre o arquivo para manter o nome exato
+        with _atomic_open(self.reference_path, "wb") as f:
+            np.savez(
+                f,
+                bbox=np.array(data["bbox"], dtype=np.int32),
+                timestamp=np.float64(data["timestamp"]),
+                detected_class=np.str_(data["detected_class"] or ""),
+                detected_strategy=np.str_(data["detected_strategy"] or ""),
+                confidence=np.float64(data["confidence"]),
+                score=np.float64(data["score"]),
+            )
+
+        with _atomic_open(self.reference_json_path, "w") as f:
             json.dump(data, f, indent=2)
 
         self.bed_bbox = bbox
         self.last_detection_time = data["timestamp"]
+        self._last_saved_record = data
 
     def load_reference(self) -> Optional[Tuple[int, int, int, int]]:
         """
-        Carrega coordenadas salvas do arquivo JSON.
+        Carrega coordenadas salvas do arquivo .npz (ou do JSON legado).
 
         Returns:
             Tuple com coordenadas ou None se arquivo não existir.
         """
         if not self.reference_path.exists():
+            return self._load_reference_json()
+
+        try:
+            with np.load(self.reference_path, allow_pickle=False) as data:
+                self.bed_bbox = tuple(int(v) for v in data["bbox"])
+                self.last_detection_time = float(data["timestamp"])
+                self.detected_class_name = str(data["detected_class"]) or None
+                self.detected_strategy = str(data["detected_strategy"]) or None
+                self.detected_confidence = float(data["confidence"])
+                self.detected_score = float(data["score"])
+            self._last_saved_record = {
+                "bbox": list(self.bed_bbox),
+                "timestamp": self.last_detection_time,
+                "detected_class": self.detected_class_name,
+                "detected_strategy": self.detected_strategy,
+                "confidence": self.detected_confidence,
+                "score": self.detected_score,
+            }
+            return self.bed_bbox
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _load_reference_json(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Carrega referência no formato JSON (instalações anteriores ao .npz).
+
+        Returns:
+            Tuple com coordenadas ou None se arquivo não existir.
+        """
+        if not self.reference_json_path.exists():
             return None
 
         try:
-            with open(self.reference_path, "r") as f:
+            with open(self.reference_json_path, "r") as f:
                 data = json.load(f)
 
             self.bed_bbox = tuple(data["bbox"])
@@ -509,6 +689,9 @@ class BedDetector:
         Returns:
             True se precisa re-verificar a cama.
         """
+        if BED_FREEZE_AFTER_CALIBRATION and self.bed_bbox is not None:
+            return False
+
         if self.last_detection_time is None:
             return True
 
@@ -560,8 +743,8 @@ class BedDetector:
         if union <= 0:
             return False
 
-        iou = intersection / union
-        return iou >= min_iou
+        # iou >= min_iou sem a divisao (union > 0)
+        return intersection >= min_iou * union
 
     def get_bed_bbox(self) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -73,16 +73,46 @@ def has_display_available() -> bool:
     return display is not None and display != ''
 
 
-def wait_for_display(timeout_seconds: int = 120, check_interval: int = 5) -> bool:
+def _probe_x11(timeout: float) -> Optional[bool]:
+    """
+    Executa uma unica consulta `xset q` ao servidor X.
+
+    Returns:
+        True se o X11 respondeu, False se falhou, None se `xset` nao existe
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['xset', 'q'],
+            capture_output=True,
+            timeout=timeout,
+            env=os.environ
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return False
+
+
+def wait_for_display(timeout_seconds: float = 120, check_interval: float = 0.5,
+                     skip_when_headless: bool = True, probe_timeout: float = 0.2) -> bool:
     """
     Aguarda até que o display (GUI) esteja disponível.
 
     Útil quando o serviço systemd inicia antes do X11/Wayland estar pronto.
     No Windows, retorna imediatamente.
 
+    Com skip_when_headless, desiste na hora quando não há DISPLAY definido
+    ou quando `xset` não está instalado (máquina sem desktop), em vez de
+    consumir o timeout inteiro no boot.
+
     Args:
         timeout_seconds: Tempo máximo de espera em segundos (default: 120)
-        check_interval: Intervalo entre verificações em segundos (default: 5)
+        check_interval: Intervalo entre verificações em segundos (default: 0.5)
+        skip_when_headless: Pula a espera se o ambiente não tem display
+        probe_timeout: Timeout de cada consulta `xset q` em segundos
 
     Returns:
         True se o display ficou disponível, False se timeout
@@ -92,31 +122,32 @@ def wait_for_display(timeout_seconds: int = 120, check_interval: int = 5) -> boo
     if IS_WINDOWS:
         return True
 
+    # Fast-path: probe unico antes de entrar no laco de espera
+    if skip_when_headless:
+        if not has_display_available():
+            print("[Display] DISPLAY não definido - pulando espera pela GUI")
+            return False
+        probe = _probe_x11(probe_timeout)
+        if probe:
+            return True
+        if probe is None:
+            print("[Display] xset não encontrado - pulando espera pela GUI")
+            return False
+
     print(f"[Display] Aguardando GUI estar disponível (timeout: {timeout_seconds}s)...")
 
-    elapsed = 0
-    while elapsed < timeout_seconds:
-        # Verifica variável DISPLAY
-        if has_display_available():
-            # Tenta verificar se o X11 está realmente funcional
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ['xset', 'q'],
-                    capture_output=True,
-                    timeout=5,
-                    env=os.environ
-                )
-                if result.returncode == 0:
-                    print(f"[Display] GUI disponível após {elapsed}s")
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                pass
+    start = time.monotonic()
+    deadline = start + timeout_seconds
+    next_report = start + 30
+    while time.monotonic() < deadline:
+        if has_display_available() and _probe_x11(probe_timeout):
+            print(f"[Display] GUI disponível após {time.monotonic() - start:.1f}s")
+            return True
 
         time.sleep(check_interval)
-        elapsed += check_interval
-        if elapsed % 30 == 0:
-            print(f"[Display] Ainda aguardando GUI... ({elapsed}s)")
+        if time.monotonic() >= next_report:
+            print(f"[Display] Ainda aguardando GUI... ({time.monotonic() - start:.0f}s)")
+            next_report += 30
 
     print(f"[Display] TIMEOUT: GUI não disponível após {timeout_seconds}s")
     return False
@@ -125,6 +156,9 @@ def wait_for_display(timeout_seconds: int = 120, check_interval: int = 5) -> boo
 class CameraBase(ABC):
     """Interface abstrata para camera."""
 
+    # True quando o espelhamento horizontal eh feito pelo hardware
+    hflip_in_sensor: bool = False
+
     @abstractmethod
     def open(self) -> bool:
         """Abre a camera. Retorna True se sucesso."""
@@ -159,17 +193,19 @@ class CameraBase(ABC):
 class CameraOpenCV(CameraBase):
     """Implementacao de camera usando OpenCV (Windows)."""
 
-    def __init__(self, camera_index: int = 0, backend: Optional[str] = None):
+    def __init__(self, camera_index: int = 0, backend: Optional[str] = None, hflip: bool = False):
         """
         Inicializa camera OpenCV.
 
         Args:
             camera_index: Indice da camera (0 = padrao)
             backend: Backend de captura ("DSHOW", "MSMF", None = auto)
+            hflip: Espelha horizontalmente cada frame lido (cv2.flip)
         """
         import cv2
         self.cv2 = cv2
         self.camera_index = camera_index
+        self.hflip = hflip
         self.cap: Optional[cv2.VideoCapture] = None
         self.width = 640
         self.height = 480
@@ -177,6 +213,9 @@ class CameraOpenCV(CameraBase):
         self._backend_name = backend
         self._consecutive_errors = 0
         self._max_errors_before_restart = 5
+        # Drenagem do buffer: no maximo N grabs; um grab que espera mais que isso eh frame novo
+        self._grab_drain_max = 4
+        self._fresh_grab_seconds = 0.01
 
     def _resolve_backend(self, backend: Optional[str]) -> int:
         """Converte string de backend para constante cv2.CAP_*."""
@@ -216,11 +255,14 @@ class CameraOpenCV(CameraBase):
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
         if self.cap is None:
             return False, None
-        # Drena frames antigos do buffer para obter o mais recente
-        self.cap.grab()
-        ret, frame = self.cap.read()
+        # Drena frames antigos do buffer e decodifica so o mais recente
+        ret, frame = False, None
+        if self._grab_latest():
+            ret, frame = self.cap.retrieve()
         if ret:
             self._consecutive_errors = 0
+            if self.hflip:
+                frame = self.cv2.flip(frame, 1)
             return True, frame
         self._consecutive_errors += 1
         if self._consecutive_errors <= 3:
@@ -231,6 +273,27 @@ class CameraOpenCV(CameraBase):
             self._restart_camera()
         return False, None
 
+    def _grab_latest(self) -> bool:
+        """
+        Descarta frames enfileirados no driver, deixando o mais novo para retrieve().
+
+        grab() nao decodifica. Um frame ja bufferizado volta quase na hora;
+        quando o grab demora (esperou o sensor), o frame obtido eh novo.
+        So cobre o buffer do driver: a frescura ate o loop principal depende
+        da fila do PosePipeline, que descarta o frame pendente mais antigo.
+
+        Returns:
+            True se ha um frame pronto para retrieve()
+        """
+        import time
+        for _ in range(self._grab_drain_max):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return False
+            if time.perf_counter() - start >= self._fresh_grab_seconds:
+                break
+        return True
+
     def _restart_camera(self) -> None:
         """Tenta reiniciar a camera com múltiplas tentativas e backoff."""
         import time
@@ -280,15 +343,53 @@ class CameraOpenCV(CameraBase):
 class CameraPicamera(CameraBase):
     """Implementacao de camera usando Picamera2 (Raspberry Pi)."""
 
-    def __init__(self):
-        """Inicializa camera Picamera2."""
+    # Conversao para BGR por formato do stream principal
+    # YUV420 (I420) trafega 1.5 bytes/px do ISP, metade do RGB888
+    # RGB888 do Picamera2 ja e BGR na memoria: COLOR_RGB2BGR (comportamento
+    # original) troca R e B; YUV420 resulta em BGR correto (ver CAPTURE_PIXEL_FORMAT)
+    _BGR_CONVERSIONS = {
+        "RGB888": "COLOR_RGB2BGR",
+        "YUV420": "COLOR_YUV2BGR_I420",
+    }
+
+    def __init__(self, pixel_format: str = "RGB888", hflip: bool = False, hflip_via_sensor: bool = True):
+        """
+        Inicializa camera Picamera2.
+
+        Args:
+            pixel_format: Formato do stream principal ("RGB888" ou "YUV420")
+            hflip: Espelha horizontalmente os frames
+            hflip_via_sensor: Aplica o espelhamento no sensor (libcamera Transform)
+                em vez de cv2.flip por frame
+        """
+        import cv2
+        self.cv2 = cv2
         self.picam2 = None
         self.width = 640
         self.height = 480
+        if pixel_format not in self._BGR_CONVERSIONS:
+            print(f"[Camera] Formato '{pixel_format}' nao suportado, usando RGB888")
+            pixel_format = "RGB888"
+        self.pixel_format = pixel_format
+        self._bgr_conversion = getattr(cv2, self._BGR_CONVERSIONS[pixel_format])
+        self.hflip = hflip
+        self.hflip_in_sensor = hflip and hflip_via_sensor
         self._is_open = False
         self._consecutive_errors = 0
         self._max_errors_before_restart = 5
 
+    def _configure_stream(self) -> None:
+        """Configura o stream principal no tamanho/formato atuais (redimensiona no ISP)."""
+        kwargs = {}
+        if self.hflip_in_sensor:
+            from libcamera import Transform
+            kwargs["transform"] = Transform(hflip=1)
+        config = self.picam2.create_preview_configuration(
+            main={"size": (self.width, self.height), "format": self.pixel_format},
+            **kwargs,
+        )
+        self.picam2.configure(config)
+
     def _cleanup_camera(self) -> None:
         """Libera recursos da camera para permitir re-inicializacao."""
         if self.picam2 is not None:
@@ -311,10 +412,7 @@ class CameraPicamera(CameraBase):
                 print(f"[Camera] Inicializando Picamera2 (tentativa {attempt}/{max_retries})...")
                 self._cleanup_camera()
                 self.picam2 = Picamera2()
-                config = self.picam2.create_preview_configuration(
-                    main={"size": (self.width, self.height), "format": "RGB888"}
-                )
-                self.picam2.configure(config)
+                self._configure_stream()
                 self.picam2.start()
                 self._is_open = True
                 self._consecutive_errors = 0
@@ -335,10 +433,11 @@ class CameraPicamera(CameraBase):
         if not self._is_open or self.picam2 is None:
             return False, None
         try:
-            # Picamera2 retorna RGB, OpenCV usa BGR
-            import cv2
+            # Picamera2 retorna RGB/YUV, OpenCV usa BGR
             frame = self.picam2.capture_array()
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            frame = self.cv2.cvtColor(frame, self._bgr_conversion)
+            if self.hflip and not self.hflip_in_sensor:
+                frame = self.cv2.flip(frame, 1)
             self._consecutive_errors = 0  # Reset em sucesso
             return True, frame
         except Exception as e:
@@ -366,10 +465,7 @@ class CameraPicamera(CameraBase):
 
                 from picamera2 import Picamera2
                 self.picam2 = Picamera2()
-                config = self.picam2.create_preview_configuration(
-                    main={"size": (self.width, self.height), "format": "RGB888"}
-                )
-                self.picam2.configure(config)
+                self._configure_stream()
                 self.picam2.start()
                 self._is_open = True
                 self._consecutive_errors = 0
@@ -407,10 +503,7 @@ class CameraPicamera(CameraBase):
         if self._is_open and self.picam2 is not None:
             print(f"[Camera] Alterando resolucao para {width}x{height}...")
             self.picam2.stop()
-            config = self.picam2.create_preview_configuration(
-                main={"size": (width, height), "format": "RGB888"}
-            )
-            self.picam2.configure(config)
+            self._configure_stream()
             self.picam2.start()
 
     def get_resolution(self) -> Tuple[int, int]:
@@ -474,26 +567,35 @@ class DisplayHeadless(DisplayBase):
         pass
 
 
-def create_camera(camera_index: int = 0, backend: Optional[str] = None) -> CameraBase:
+def create_camera(
+    camera_index: int = 0,
+    backend: Optional[str] = None,
+    pixel_format: str = "RGB888",
+    hflip: bool = False,
+    hflip_via_sensor: bool = True,
+) -> CameraBase:
     """
     Cria instancia de camera apropriada para a plataforma.
 
     Args:
         camera_index: Indice da camera (usado apenas no Windows)
         backend: Backend OpenCV ("DSHOW", "MSMF", None = auto). Ignorado no Picamera2.
+        pixel_format: Formato do stream Picamera2 ("RGB888", "YUV420"). Ignorado no OpenCV.
+        hflip: Espelha horizontalmente os frames
+        hflip_via_sensor: No Picamera2, espelha no sensor; no OpenCV sempre usa cv2.flip
 
     Returns:
         Instancia de CameraBase
     """
     if IS_WINDOWS:
         print(f"[Camera] Plataforma Windows - usando OpenCV")
-        return CameraOpenCV(camera_index, backend=backend)
+        return CameraOpenCV(camera_index, backend=backend, hflip=hflip)
     elif IS_LINUX:
         print(f"[Camera] Plataforma Linux - usando Picamera2")
-        return CameraPicamera()
+        return CameraPicamera(pixel_format=pixel_format, hflip=hflip, hflip_via_sensor=hflip_via_sensor)
     else:
         print(f"[Camera] Plataforma {PLATFORM} - tentando OpenCV")
-        return CameraOpenCV(camera_index, backend=backend)
+        return CameraOpenCV(camera_index, backend=backend, hflip=hflip)
 
 
 def create_display(headless: bool = False) -> DisplayBase:
@@ -7,7 +7,15 @@ import threading
 import time
 from typing import Optional
 
-from config import GPIO_PIN_ALERT, GPIO_PIN_SYSTEM_READY, GPIO_BLINK_INTERVAL, GPIO_ALERT_DURATION, GPIO_REAL_MODE
+from config import (
+    GPIO_ALERT_DURATION,
+    GPIO_ALERT_PWM_CHANNEL,
+    GPIO_ALERT_USE_HW_PWM,
+    GPIO_BLINK_INTERVAL,
+    GPIO_PIN_ALERT,
+    GPIO_PIN_SYSTEM_READY,
+    GPIO_REAL_MODE,
+)
 
 # Detecta plataforma
 import platform
@@ -24,6 +32,7 @@ class GPIOAlertManager:
         self._alert_active = threading.Event()
         self._alert_restart = threading.Event()  # Sinaliza re-trigger do timer
         self._system_ready = False
+        self._pwm = None  # HardwarePWM quando GPIO_ALERT_USE_HW_PWM
 
         if self.is_raspberry_pi:
             self._setup_gpio()
@@ -88,6 +97,23 @@ class GPIOAlertManager:
         except Exception as e:
             print(f"[GPIO] Erro ao configurar: {e} - modo simulado")
 
+        if GPIO_ALERT_USE_HW_PWM and self.gpio_available:
+            self._setup_hw_pwm()
+
+    def _setup_hw_pwm(self) -> None:
+        """Configura PWM de hardware para o pisca de alerta (onda quadrada 50%)."""
+        try:
+            from rpi_hardware_pwm import HardwarePWM
+            self._pwm = HardwarePWM(
+                pwm_channel=GPIO_ALERT_PWM_CHANNEL,
+                hz=1.0 / (2 * GPIO_BLINK_INTERVAL),
+            )
+            print(f"[GPIO] Alerta via PWM de hardware (canal {GPIO_ALERT_PWM_CHANNEL})")
+        except ImportError:
+            print("[GPIO] rpi_hardware_pwm nao disponivel - pisca por software")
+        except Exception as e:
+            print(f"[GPIO] Erro ao configurar PWM: {e} - pisca por software")
+
     def set_system_ready(self, ready: bool) -> None:
         """Liga/desliga indicador de sistema configurado (GPIO 20)."""
         self._system_ready = ready
@@ -113,43 +139,56 @@ class GPIOAlertManager:
         """Para o pisca-pisca de alerta."""
         self._alert_active.clear()
         if self._alert_thread is not None and self._alert_thread.is_alive():
+            self._alert_restart.set()  # Acorda a thread em espera (modo PWM)
             self._alert_thread.join(timeout=1.0)
         self._alert_thread = None
 
         # Garante que LED fica desligado
-        if self.is_raspberry_pi and self.gpio_available:
+        if self.is_raspberry_pi and self.gpio_available and self._pwm is None:
             self.GPIO.output(GPIO_PIN_ALERT, self.GPIO.LOW)
 
     def _alert_blink_loop(self) -> None:
         """Loop que pisca o LED de alerta por tempo limitado."""
         blink_state = False
-        start_time = time.time()
+        # Prazo absoluto em relogio monotonico (imune a ajustes de NTP/RTC)
+        deadline = time.monotonic() + GPIO_ALERT_DURATION
+
+        # PWM de hardware gera o pisca; a thread so controla a duracao
+        if self._pwm is not None:
+            self._pwm.start(50)
 
         while self._alert_active.is_set():
-            # Re-trigger: reseta o timer quando start_risk_alert() eh chamado novamente
+            # Re-trigger: reseta o prazo quando start_risk_alert() eh chamado novamente
             if self._alert_restart.is_set():
-                start_time = time.time()
+                deadline = time.monotonic() + GPIO_ALERT_DURATION
                 self._alert_restart.clear()
 
             # Verifica se excedeu a duracao maxima
-            elapsed = time.time() - start_time
-            if elapsed >= GPIO_ALERT_DURATION:
+            now = time.monotonic()
+            if now >= deadline:
                 print(f"[GPIO] Alerta encerrado apos {GPIO_ALERT_DURATION}s")
                 break
 
+            if self._pwm is not None:
+                # Dorme ate o prazo, re-trigger ou stop
+                self._alert_restart.wait(timeout=deadline - now)
+                continue
+
             blink_state = not blink_state
             if self.is_raspberry_pi and self.gpio_available:
                 self.GPIO.output(GPIO_PIN_ALERT, self.GPIO.HIGH if blink_state else self.GPIO.LOW)
             else:
                 status = "LIGADO" if blink_state else "DESLIGADO"
-                remaining = int(GPIO_ALERT_DURATION - elapsed)
+                remaining = int(deadline - now)
                 print(f"[GPIO SIMULADO] Alerta: {status} (GPIO {GPIO_PIN_ALERT}) - {remaining}s restantes")
 
             time.sleep(GPIO_BLINK_INTERVAL)
 
         # Garante LED desligado ao finalizar
         self._alert_active.clear()
-        if self.is_raspberry_pi and self.gpio_available:
+        if self._pwm is not None:
+            self._pwm.stop()
+        elif self.is_raspberry_pi and self.gpio_available:
             self.GPIO.output(GPIO_PIN_ALERT, self.GPIO.LOW)
 
     def cleanup(self) -> None:
@@ -4,10 +4,16 @@ Gerencia buffer circular de dados e status do monitoramento.
 """
 
 import time
-from collections import deque
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 
-from config import FEATURE_BUFFER_SIZE
+import numpy as np
+
+from config import FEATURE_BUFFER_DTYPE, FEATURE_BUFFER_SIZE, FEATURE_COLUMNS
+
+# Índices das colunas no buffer SoA
+_COL_TIMESTAMP = FEATURE_COLUMNS.index("timestamp")
+_COL_BBOX = slice(FEATURE_COLUMNS.index("x1"), FEATURE_COLUMNS.index("y2") + 1)
+_BUFFER_DTYPE = np.dtype(FEATURE_BUFFER_DTYPE)
 
 
 class PatientMonitor:
@@ -21,7 +27,10 @@ class PatientMonitor:
             bed_bbox: Tuple (x1, y1, x2, y2) com coordenadas da cama.
         """
         self.bed_bbox = bed_bbox
-        self.buffer: deque = deque(maxlen=FEATURE_BUFFER_SIZE)
+        # Ring buffer pré-alocado (uma linha por frame, uma coluna por feature)
+        self.buffer = np.zeros((FEATURE_BUFFER_SIZE, len(FEATURE_COLUMNS)), dtype=_BUFFER_DTYPE)
+        self._write_idx: int = 0
+        self._count: int = 0
         self.persons_count: int = 0
         self.status: str = "Cama Vazia"
         self.last_update: float = time.time()
@@ -47,7 +56,7 @@ class PatientMonitor:
 
         if persons_count == 0:
             self.status = "Cama Vazia"
-            self.buffer.clear()
+            self.clear_buffer()
         elif persons_count > 1:
             self.status = "Acompanhado"
         else:
@@ -60,21 +69,12 @@ class PatientMonitor:
         Args:
             patient_bbox: Tuple (x1, y1, x2, y2) do paciente detectado.
         """
-        x1, y1, x2, y2 = patient_bbox
-        center_x = (x1 + x2) / 2
-        center_y = (y1 + y2) / 2
-
-        frame_data = {
-            "timestamp": time.time(),
-            "bbox": patient_bbox,
-            "y_top": y1,
-            "center_x": center_x,
-            "center_y": center_y,
-            "width": x2 - x1,
-            "height": y2 - y1,
-        }
+        row = self.buffer[self._write_idx]
+        row[_COL_TIMESTAMP] = time.time()
+        row[_COL_BBOX] = patient_bbox
 
-        self.buffer.append(frame_data)
+        self._write_idx = (self._write_idx + 1) % FEATURE_BUFFER_SIZE
+        self._count = min(self._count + 1, FEATURE_BUFFER_SIZE)
 
     def get_status(self) -> str:
         """
@@ -101,7 +101,7 @@ class PatientMonitor:
         Returns:
             Número de frames no buffer.
         """
-        return len(self.buffer)
+        return self._count
 
     def get_latest_bbox(self) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -110,9 +110,10 @@ class PatientMonitor:
         Returns:
             Tuple com bbox ou None se buffer vazio.
         """
-        if len(self.buffer) == 0:
+        if self._count == 0:
             return None
-        return self.buffer[-1]["bbox"]
+        last = self.buffer[(self._write_idx - 1) % FEATURE_BUFFER_SIZE]
+        return tuple(int(v) for v in last[_COL_BBOX])
 
     def get_tracking_duration(self) -> float:
         """
@@ -121,12 +122,11 @@ class PatientMonitor:
         Returns:
             Tempo desde o primeiro frame no buffer.
         """
-        if len(self.buffer) < 2:
+        if self._count < 2:
             return 0.0
 
-        first_timestamp = self.buffer[0]["timestamp"]
-        last_timestamp = self.buffer[-1]["timestamp"]
-        return last_timestamp - first_timestamp
+        timestamps = self.buffer[:self._count, _COL_TIMESTAMP]
+        return float(timestamps.max() - timestamps.min())
 
     def is_buffer_full(self) -> bool:
         """
@@ -135,8 +135,9 @@ class PatientMonitor:
         Returns:
             True se buffer atingiu capacidade máxima.
         """
-        return len(self.buffer) == self.buffer.maxlen
+        return self._count == FEATURE_BUFFER_SIZE
 
     def clear_buffer(self) -> None:
         """Limpa o buffer de dados."""
-        self.buffer.clear()
+        self._write_idx = 0
+        self._count = 0
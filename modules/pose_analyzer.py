@@ -7,7 +7,7 @@ em relacao a area da cama para determinar risco de queda.
 
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -28,14 +28,7 @@ from config import (
     GRACE_PERIOD_AFTER_ACOMPANHADO,
     MULTI_PERSON_MAJORITY_MIN,
     MULTI_PERSON_WINDOW_SIZE,
-    KP_LEFT_ANKLE,
-    KP_LEFT_HIP,
-    KP_LEFT_KNEE,
-    KP_LEFT_SHOULDER,
-    KP_RIGHT_ANKLE,
-    KP_RIGHT_HIP,
-    KP_RIGHT_KNEE,
-    KP_RIGHT_SHOULDER,
+    KP_TORSO_LEGS_IDX,
     LYING_MAX_ASPECT_RATIO,
     NECK_ABOVE_BED_SITTING_RATIO,
     PERSON_BED_CONTAINMENT_MIN,
@@ -52,6 +45,9 @@ from config import (
     TORSO_RATIO_MIN_FOR_LYING,
 )
 
+# Indices do gather convertidos uma vez (fancy indexing com tupla seria outra semantica)
+_KP_IDX = np.asarray(KP_TORSO_LEGS_IDX, dtype=np.intp)
+
 
 @dataclass
 class BodyPoints:
@@ -189,6 +185,7 @@ class PoseAnalyzer:
             frames_patient_detected: Frames para confirmar paciente na cama
         """
         self.bed_bbox = bed_bbox
+        self._bed_zone = self._compute_bed_zone(bed_bbox)
         self.confidence_high = confidence_high
         self.confidence_min = confidence_min
         self.frames_to_confirm = frames_to_confirm
@@ -199,26 +196,49 @@ class PoseAnalyzer:
         self.detection_buffer: deque = deque(maxlen=frames_patient_detected)
 
         # EMA para suavização de confiança de keypoints
-        self._confidence_ema: Dict[int, float] = {}
+        self._confidence_ema: Optional[np.ndarray] = None
         self._confidence_alpha = CONFIDENCE_EMA_ALPHA
 
     def smooth_confidences(self, confidences: np.ndarray) -> np.ndarray:
         """Aplica EMA às confianças de keypoints para evitar flickering."""
-        smoothed = confidences.copy()
-        for i in range(len(confidences)):
-            if i in self._confidence_ema:
-                smoothed[i] = (self._confidence_alpha * confidences[i] +
-                               (1 - self._confidence_alpha) * self._confidence_ema[i])
-            self._confidence_ema[i] = float(smoothed[i])
+        previous = self._confidence_ema
+        if previous is None or previous.shape != confidences.shape:
+            smoothed = confidences.copy()
+        else:
+            smoothed = (self._confidence_alpha * confidences +
+                        (1 - self._confidence_alpha) * previous).astype(confidences.dtype)
+        self._confidence_ema = smoothed.astype(np.float64)
         return smoothed
 
     def reset_confidence_ema(self) -> None:
         """Reseta estado da suavização de confiança."""
-        self._confidence_ema.clear()
+        self._confidence_ema = None
 
     def update_bed_bbox(self, bed_bbox: Tuple[int, int, int, int]) -> None:
         """Atualiza bbox da cama."""
         self.bed_bbox = bed_bbox
+        self._bed_zone = self._compute_bed_zone(bed_bbox)
+
+    @staticmethod
+    def _compute_bed_zone(
+        bed_bbox: Tuple[int, int, int, int],
+    ) -> Tuple[float, float, float, float]:
+        """
+        Calcula a zona expandida da cama (bbox + margens assimetricas).
+
+        Calculada uma vez por bbox; is_point_in_bed so compara coordenadas.
+        """
+        x1, y1, x2, y2 = bed_bbox
+        bed_width = x2 - x1
+        bed_height = y2 - y1
+
+        # Margens assimetricas (y1=topo da imagem, y2=base)
+        return (
+            x1 - bed_width * BED_MARGIN_LEFT,
+            y1 - bed_height * BED_MARGIN_TOP,
+            x2 + bed_width * BED_MARGIN_RIGHT,
+            y2 + bed_height * BED_MARGIN_BOTTOM,
+        )
 
     def extract_body_points(
         self,
@@ -237,11 +257,19 @@ class PoseAnalyzer:
         """
         body = BodyPoints()
 
-        # Extrai ombros para calcular pescoco
-        left_shoulder = keypoints[KP_LEFT_SHOULDER]
-        right_shoulder = keypoints[KP_RIGHT_SHOULDER]
-        left_shoulder_conf = confidences[KP_LEFT_SHOULDER]
-        right_shoulder_conf = confidences[KP_RIGHT_SHOULDER]
+        # Gather unico dos 8 keypoints usados (ordem de KP_TORSO_LEGS_IDX)
+        (
+            left_shoulder, right_shoulder,
+            left_hip, right_hip,
+            left_knee, right_knee,
+            left_ankle, right_ankle,
+        ) = keypoints[_KP_IDX].tolist()
+        (
+            left_shoulder_conf, right_shoulder_conf,
+            left_hip_conf, right_hip_conf,
+            left_knee_conf, right_knee_conf,
+            left_ankle_conf, right_ankle_conf,
+        ) = confidences[_KP_IDX].tolist()
 
         # Calcula ponto medio dos ombros (pescoco)
         if left_shoulder_conf >= self.confidence_min and right_shoulder_conf >= self.confidence_min:
@@ -252,18 +280,12 @@ class PoseAnalyzer:
 
         # Armazena ombros individuais
         if left_shoulder_conf >= self.confidence_min:
-            body.left_shoulder = (float(left_shoulder[0]), float(left_shoulder[1]))
-            body.left_shoulder_conf = float(left_shoulder_conf)
+            body.left_shoulder = (left_shoulder[0], left_shoulder[1])
+            body.left_shoulder_conf = left_shoulder_conf
 
         if right_shoulder_conf >= self.confidence_min:
-            body.right_shoulder = (float(right_shoulder[0]), float(right_shoulder[1]))
-            body.right_shoulder_conf = float(right_shoulder_conf)
-
-        # Extrai quadris para calcular ponto medio
-        left_hip = keypoints[KP_LEFT_HIP]
-        right_hip = keypoints[KP_RIGHT_HIP]
-        left_hip_conf = confidences[KP_LEFT_HIP]
-        right_hip_conf = confidences[KP_RIGHT_HIP]
+            body.right_shoulder = (right_shoulder[0], right_shoulder[1])
+            body.right_shoulder_conf = right_shoulder_conf
 
         # Calcula ponto medio dos quadris
         if left_hip_conf >= self.confidence_min and right_hip_conf >= self.confidence_min:
@@ -272,28 +294,20 @@ class PoseAnalyzer:
             body.hip_center = (hip_x, hip_y)
             body.hip_conf = min(left_hip_conf, right_hip_conf)
 
-        # Extrai joelhos (se confianca suficiente)
-        left_knee = keypoints[KP_LEFT_KNEE]
-        left_knee_conf = confidences[KP_LEFT_KNEE]
+        # Joelhos (se confianca suficiente)
         if left_knee_conf >= self.confidence_min:
             body.left_knee = (left_knee[0], left_knee[1])
             body.left_knee_conf = left_knee_conf
 
-        right_knee = keypoints[KP_RIGHT_KNEE]
-        right_knee_conf = confidences[KP_RIGHT_KNEE]
         if right_knee_conf >= self.confidence_min:
             body.right_knee = (right_knee[0], right_knee[1])
             body.right_knee_conf = right_knee_conf
 
-        # Extrai tornozelos (se confianca suficiente)
-        left_ankle = keypoints[KP_LEFT_ANKLE]
-        left_ankle_conf = confidences[KP_LEFT_ANKLE]
+        # Tornozelos (se confianca suficiente)
         if left_ankle_conf >= self.confidence_min:
             body.left_ankle = (left_ankle[0], left_ankle[1])
             body.left_ankle_conf = left_ankle_conf
 
-        right_ankle = keypoints[KP_RIGHT_ANKLE]
-        right_ankle_conf = confidences[KP_RIGHT_ANKLE]
         if right_ankle_conf >= self.confidence_min:
             body.right_ankle = (right_ankle[0], right_ankle[1])
             body.right_ankle_conf = right_ankle_conf
@@ -317,15 +331,7 @@ class PoseAnalyzer:
         Returns:
             True se ponto esta dentro da zona expandida da cama
         """
-        x1, y1, x2, y2 = self.bed_bbox
-        bed_width = x2 - x1
-        bed_height = y2 - y1
-
-        # Margens assimetricas (y1=topo da imagem, y2=base)
-        x1_expanded = x1 - bed_width * BED_MARGIN_LEFT
-        x2_expanded = x2 + bed_width * BED_MARGIN_RIGHT
-        y1_expanded = y1 - bed_height * BED_MARGIN_TOP
-        y2_expanded = y2 + bed_height * BED_MARGIN_BOTTOM
+        x1_expanded, y1_expanded, x2_expanded, y2_expanded = self._bed_zone
 
         px, py = point
         return x1_expanded <= px <= x2_expanded and y1_expanded <= py <= y2_expanded
@@ -729,6 +735,27 @@ class PoseStateMachine:
         self.patient_confirmed = False
 
 
+# Indices dos scores EMA no vetor de scores da PoseStateMachineEMA
+_SCORE_VISIBLE = 0
+_SCORE_IN_BED = 1
+_SCORE_RISK = 2
+_SCORE_OUT = 3
+_SCORE_SAFE = 4
+_NUM_SCORES = 5
+
+
+def _score_property(index: int) -> property:
+    """Expoe uma posicao do vetor de scores EMA como atributo float."""
+    def getter(self) -> float:
+        return float(self._scores[index])
+
+    def setter(self, value: float) -> None:
+        self._scores[index] = value
+        self._scores_snapshot = None
+
+    return property(getter, setter)
+
+
 class PoseStateMachineEMA:
     """
     Maquina de estados para pose do paciente usando EMA.
@@ -744,6 +771,13 @@ class PoseStateMachineEMA:
     PACIENTE_FORA = "PACIENTE_FORA"
     ACOMPANHADO = "ACOMPANHADO"
 
+    # Scores EMA para cada condicao (visoes sobre self._scores)
+    score_patient_visible = _score_property(_SCORE_VISIBLE)  # Paciente visivel (independente de posicao)
+    score_patient_in_bed = _score_property(_SCORE_IN_BED)    # Paciente detectado na cama
+    score_risk = _score_property(_SCORE_RISK)                # Alguns pontos fora da cama
+    score_out = _score_property(_SCORE_OUT)                  # Todos pontos fora da cama
+    score_safe = _score_property(_SCORE_SAFE)                # Todos pontos dentro da cama
+
     def __init__(
         self,
         alpha: float = EMA_ALPHA,
@@ -768,12 +802,30 @@ class PoseStateMachineEMA:
         self.current_state = self.AGUARDANDO
         self.patient_confirmed = False
 
-        # Scores EMA para cada condicao
-        self.score_patient_in_bed = 0.0    # Paciente detectado na cama
-        self.score_risk = 0.0              # Alguns pontos fora da cama
-        self.score_out = 0.0               # Todos pontos fora da cama
-        self.score_safe = 0.0              # Todos pontos dentro da cama
-        self.score_patient_visible = 0.0   # Paciente visivel (independente de posicao)
+        self._one_minus_alpha = 1.0 - alpha  # Pré-calculado para o decaimento
+
+        # Scores EMA para cada condicao, em um unico vetor (atualizacao vetorizada)
+        self._scores = np.zeros(_NUM_SCORES, dtype=np.float64)
+        self._signals = np.zeros(_NUM_SCORES, dtype=np.float64)
+        # Dict de get_scores(), refeito so quando os scores mudam
+        self._scores_snapshot: Optional[dict] = None
+
+        # Paineis de thresholds alinhados ao vetor de scores: todas as comparacoes
+        # do frame saem de tres operacoes vetorizadas (inf/-inf = nao se aplica)
+        inf = np.inf
+        # score >= enter: paciente na cama, entra em risco, entra em fora;
+        # safe usa o proximo float acima de exit_safe (equivale a score > exit_safe)
+        self._thresh_enter = np.array([
+            inf,
+            threshold_patient_detected,
+            threshold_enter_risk,
+            threshold_enter_out,
+            np.nextafter(threshold_exit_safe, inf),
+        ])
+        # score < exit: sai de risco, sai de fora
+        self._thresh_exit = np.array([-inf, -inf, threshold_exit_risk, threshold_exit_out, -inf])
+        # Dados insuficientes: todos os scores abaixo destes limites
+        self._thresh_insufficient = np.array([0.3, inf, 0.2, 0.2, 0.2])
 
         # Contador para rastrear frames sem deteccao de pessoa
         self._frames_without_person = 0
@@ -809,6 +861,8 @@ class PoseStateMachineEMA:
         Returns:
             Estado atual
         """
+        self._scores_snapshot = None
+
         # Se mais de uma pessoa, exige maioria na janela antes de transitar
         self._multi_person_window.append(person_count > 1)
         if person_count > 1:
@@ -962,12 +1016,14 @@ class PoseStateMachineEMA:
                     signal_safe = 0.0
                     signal_out = 0.0
 
-        # Atualiza scores EMA
-        self.score_patient_visible = self._ema(self.score_patient_visible, signal_patient_visible)
-        self.score_patient_in_bed = self._ema(self.score_patient_in_bed, signal_patient_in_bed)
-        self.score_risk = self._ema(self.score_risk, signal_risk)
-        self.score_out = self._ema(self.score_out, signal_out)
-        self.score_safe = self._ema(self.score_safe, signal_safe)
+        # Atualiza scores EMA (todos de uma vez)
+        signals = self._signals
+        signals[_SCORE_VISIBLE] = signal_patient_visible
+        signals[_SCORE_IN_BED] = signal_patient_in_bed
+        signals[_SCORE_RISK] = signal_risk
+        signals[_SCORE_OUT] = signal_out
+        signals[_SCORE_SAFE] = signal_safe
+        self._scores += self.alpha * (signals - self._scores)
 
         # Atualiza estado baseado nos scores
         self._update_state_from_scores(person_count)
@@ -978,25 +1034,20 @@ class PoseStateMachineEMA:
         """Retorna True se pelo menos min_count elementos da janela sao True."""
         return sum(window) >= min_count
 
-    def _ema(self, previous: float, current: float) -> float:
-        """Calcula Media Movel Exponencial."""
-        return self.alpha * current + (1 - self.alpha) * previous
-
     def _decay_all_scores(self) -> None:
-        """Decai todos os scores quando nao ha deteccao."""
-        self.score_patient_visible = self._ema(self.score_patient_visible, 0.0)
-        self.score_patient_in_bed = self._ema(self.score_patient_in_bed, 0.0)
-        self.score_risk = self._ema(self.score_risk, 0.0)
-        self.score_out = self._ema(self.score_out, 0.0)
-        self.score_safe = self._ema(self.score_safe, 0.0)
+        """Decai todos os scores quando nao ha deteccao (EMA com sinal zero)."""
+        self._scores *= self._one_minus_alpha
 
     def _update_state_from_scores(self, person_count: int = 1) -> None:
         """Atualiza estado baseado nos scores EMA."""
+        scores = self._scores
+        above = scores >= self._thresh_enter
+        below = scores < self._thresh_exit
 
         # Estado AGUARDANDO - esperando paciente ser detectado na cama
         if self.current_state == self.AGUARDANDO:
             # Paciente confirmado na cama = inicia monitoramento
-            if self.score_patient_in_bed >= self.threshold_patient_detected:
+            if above[_SCORE_IN_BED]:
                 self.current_state = self.MONITORANDO
                 self.patient_confirmed = True
                 self._in_grace_period = False
@@ -1017,12 +1068,7 @@ class PoseStateMachineEMA:
         # sinal positivo esta sendo recebido (keypoints fracos ou deteccao ruidosa).
         # Sem isso, RISCO_POTENCIAL/PACIENTE_FORA ficam em deadlock porque
         # a condicao de saida exige score_safe > threshold, que nunca sobe sem sinal.
-        insufficient_data = (
-            self.score_risk < 0.2 and
-            self.score_out < 0.2 and
-            self.score_safe < 0.2 and
-            self.score_patient_visible < 0.3
-        )
+        insufficient_data = bool((scores < self._thresh_insufficient).all())
 
         # Estado PACIENTE_FORA
         if self.current_state == self.PACIENTE_FORA:
@@ -1033,14 +1079,14 @@ class PoseStateMachineEMA:
                 return
 
             # Sai de PACIENTE_FORA se score de "fora" cair E paciente voltar para cama
-            if self.score_out < self.threshold_exit_out and self.score_safe > self.threshold_exit_safe:
+            if below[_SCORE_OUT] and above[_SCORE_SAFE]:
                 self.current_state = self.MONITORANDO
             # Ou se entrar em risco parcial
-            elif self.score_out < self.threshold_exit_out and self.score_risk >= self.threshold_enter_risk:
+            elif below[_SCORE_OUT] and above[_SCORE_RISK]:
                 self.current_state = self.RISCO_POTENCIAL
             # Escape: score_out caiu mas safe/risk nao atingem thresholds (faixa morta)
             # Transita para RISCO_POTENCIAL como estado intermediario seguro
-            elif self.score_out < self.threshold_exit_out:
+            elif below[_SCORE_OUT]:
                 self.current_state = self.RISCO_POTENCIAL
             return
 
@@ -1053,10 +1099,10 @@ class PoseStateMachineEMA:
                 return
 
             # Escala para PACIENTE_FORA se todos pontos sairem
-            if self.score_out >= self.threshold_enter_out:
+            if above[_SCORE_OUT]:
                 self.current_state = self.PACIENTE_FORA
             # Volta para MONITORANDO apenas se risco diminuir E seguro subir o suficiente
-            elif self.score_risk < self.threshold_exit_risk and self.score_safe > self.threshold_exit_safe:
+            elif below[_SCORE_RISK] and above[_SCORE_SAFE]:
                 self.current_state = self.MONITORANDO
             return
 
@@ -1073,11 +1119,11 @@ class PoseStateMachineEMA:
                 return
 
             # Entra em RISCO_POTENCIAL (alguns pontos fora ou sentado)
-            if self.score_risk >= self.threshold_enter_risk:
+            if above[_SCORE_RISK]:
                 self.current_state = self.RISCO_POTENCIAL
             # Entra em PACIENTE_FORA apenas se ja passou por RISCO_POTENCIAL
             # (evita salto direto MONITORANDO->PACIENTE_FORA em 2 frames)
-            elif self.score_out >= self.threshold_enter_out:
+            elif above[_SCORE_OUT]:
                 self.current_state = self.RISCO_POTENCIAL
             return
 
@@ -1086,14 +1132,21 @@ class PoseStateMachineEMA:
         return self.current_state
 
     def get_scores(self) -> dict:
-        """Retorna scores EMA atuais para debug/visualizacao."""
-        return {
-            "visible": self.score_patient_visible,
-            "in_bed": self.score_patient_in_bed,
-            "risk": self.score_risk,
-            "out": self.score_out,
-            "safe": self.score_safe,
-        }
+        """
+        Retorna scores EMA atuais para debug/visualizacao.
+
+        O dict e reaproveitado entre chamadas ate o proximo update()/reset();
+        trate como somente leitura.
+        """
+        if self._scores_snapshot is None:
+            self._scores_snapshot = {
+                "visible": self.score_patient_visible,
+                "in_bed": self.score_patient_in_bed,
+                "risk": self.score_risk,
+                "out": self.score_out,
+                "safe": self.score_safe,
+            }
+        return self._scores_snapshot
 
     def is_patient_confirmed(self) -> bool:
         """Retorna se paciente foi confirmado na cama."""
@@ -1103,11 +1156,8 @@ class PoseStateMachineEMA:
         """Reseta maquina de estados e scores."""
         self.current_state = self.AGUARDANDO
         self.patient_confirmed = False
-        self.score_patient_visible = 0.0
-        self.score_patient_in_bed = 0.0
-        self.score_risk = 0.0
-        self.score_out = 0.0
-        self.score_safe = 0.0
+        self._scores.fill(0.0)
+        self._scores_snapshot = None
         self._frames_without_person = 0
         self._standing_window.clear()
         self._sitting_window.clear()
@@ -0,0 +1,216 @@
+"""
+Pipeline de captura + inferencia de pose em thread dedicada.
+
+A thread de trabalho le a camera, normaliza o frame e roda o YOLOv8-Pose
+enquanto a thread principal analisa, desenha e exibe o frame anterior.
+As etapas se comunicam por uma fila limitada com descarte do mais antigo:
+se o loop principal atrasa, o frame pendente e substituido pelo novo, e o
+trabalhador nunca bloqueia segurando um frame ja capturado.
+
+A cadencia (TARGET_FPS) e aplicada na captura, de modo que o frame entregue
+ao loop principal e sempre recente.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from config import FRAME_BUDGET_SECONDS, POSE_EVERY_N_FRAMES, PREDICT_KWARGS_POSE
+
+
+class FramePacer:
+    """
+    Cadencia por deadline: dorme so o que falta ate o proximo tick.
+
+    Frames lentos nao pagam um sleep fixo extra; apos um atraso a contagem
+    recomeca do instante atual (sem rajada para "recuperar" ticks perdidos).
+    """
+
+    def __init__(self, period: float = FRAME_BUDGET_SECONDS):
+        self.period = period
+        self._next_tick = time.perf_counter()
+
+    def wait(self) -> None:
+        """Dorme ate o proximo tick e agenda o seguinte."""
+        now = time.perf_counter()
+        if self._next_tick > now:
+            time.sleep(self._next_tick - now)
+            now = self._next_tick
+        self._next_tick = max(self._next_tick + self.period, now)
+
+
+@dataclass
+class PoseDetections:
+    """Saida do YOLOv8-Pose ja copiada para NumPy (uma transferencia por tensor)."""
+    keypoints: np.ndarray                    # (N, K, 2) coordenadas xy
+    confidences: Optional[np.ndarray]        # (N, K) ou None
+    boxes: Optional[np.ndarray]              # (N, 4) xyxy ou None
+
+    @classmethod
+    def from_result(cls, result) -> Optional["PoseDetections"]:
+        """
+        Converte um ultralytics Results; None se nao houver pessoa com keypoints.
+        """
+        if result is None or result.keypoints is None:
+            return None
+        keypoints_data = result.keypoints
+        if keypoints_data.xy is None or len(keypoints_data.xy) == 0:
+            return None
+
+        confidences = None
+        if keypoints_data.conf is not None and len(keypoints_data.conf) > 0:
+            confidences = keypoints_data.conf.cpu().numpy()
+
+        boxes = None
+        if result.boxes is not None and len(result.boxes) > 0:
+            boxes = result.boxes.xyxy.cpu().numpy()
+
+        return cls(keypoints=keypoints_data.xy.cpu().numpy(), confidences=confidences, boxes=boxes)
+
+
+@dataclass
+class PipelineFrame:
+    """Frame capturado e, quando inferido, o resultado do YOLOv8-Pose."""
+    ok: bool                                 # False se a captura falhou
+    frame: Optional[np.ndarray] = None       # Frame normalizado (IR)
+    raw_frame: Optional[np.ndarray] = None   # Frame cru (antes da normalizacao)
+    detections: Optional[PoseDetections] = None  # Deteccoes de pose (None = ninguem)
+    inferred: bool = False                   # True se o pose rodou neste frame
+    frame_idx: int = 0                       # Indice do frame capturado com sucesso
+    error: Optional[Exception] = None        # Excecao levantada na captura/inferencia
+
+
+class PosePipeline:
+    """Captura e infere pose numa thread, entregando frames prontos ao loop principal."""
+
+    def __init__(
+        self,
+        camera,
+        yolo_pose,
+        preprocess: Callable[[np.ndarray], np.ndarray],
+        asynchronous: bool = True,
+        queue_size: int = 1,
+    ):
+        """
+        Inicializa o pipeline.
+
+        Args:
+            camera: Camera ja aberta (CameraBase)
+            yolo_pose: Modelo YOLO de pose
+            preprocess: Funcao aplicada ao frame antes da inferencia
+            asynchronous: Se False, captura e infere na thread que chama get()
+            queue_size: Frames processados aguardando o loop principal
+        """
+        self.camera = camera
+        self.yolo_pose = yolo_pose
+        self.preprocess = preprocess
+        self.asynchronous = asynchronous
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._frame_idx = 0
+        self._pacer = FramePacer()
+
+    def start(self) -> None:
+        """Inicia a thread de trabalho (no modo assincrono)."""
+        if not self.asynchronous or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="PosePipeline", daemon=True)
+        self._thread.start()
+
+    def get(self, timeout: Optional[float] = None) -> PipelineFrame:
+        """
+        Retorna o proximo frame processado.
+
+        Args:
+            timeout: Espera maxima em segundos (modo assincrono)
+
+        Returns:
+            PipelineFrame com o frame e o resultado da inferencia
+
+        Raises:
+            queue.Empty: Se nenhum frame ficou pronto dentro do timeout
+        """
+        if not self.asynchronous:
+            self._pacer.wait()
+            return self._produce()
+        return self._queue.get(timeout=timeout)
+
+    def stop(self) -> None:
+        """Para a thread de trabalho e descarta frames pendentes."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _produce(self) -> PipelineFrame:
+        """Captura um frame, normaliza e roda o pose quando for a vez."""
+        try:
+            ret, frame = self.camera.read()
+            if not ret or frame is None:
+                return PipelineFrame(ok=False, frame_idx=self._frame_idx)
+
+            frame_idx = self._frame_idx
+            self._frame_idx += 1
+
+            # Frame cru para ASETO (antes da normalização IR)
+            raw_frame = frame.copy()
+            frame = self.preprocess(frame)
+
+            # Pose a cada POSE_EVERY_N_FRAMES; nos demais o loop reaproveita o ultimo resultado
+            inferred = frame_idx % POSE_EVERY_N_FRAMES == 0
+            detections = None
+            if inferred:
+                # stream: um unico Results por frame; copia para NumPy aqui,
+                # fora da thread principal
+                result = next(self.yolo_pose.predict(frame, **PREDICT_KWARGS_POSE), None)
+                detections = PoseDetections.from_result(result)
+
+            return PipelineFrame(
+                ok=True,
+                frame=frame,
+                raw_frame=raw_frame,
+                detections=detections,
+                inferred=inferred,
+                frame_idx=frame_idx,
+            )
+        except Exception as e:
+            return PipelineFrame(ok=False, frame_idx=self._frame_idx, error=e)
+
+    def _run(self) -> None:
+        """Loop da thread de trabalho."""
+        while not self._stop_event.is_set():
+            self._pacer.wait()
+            item = self._produce()
+
+            # Fila cheia = loop principal ocupado; descarta o frame antigo (drop-oldest)
+            self._put_latest(item)
+
+    def _put_latest(self, item: PipelineFrame) -> None:
+        """Enfileira o item substituindo o mais antigo se a fila estiver cheia."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._queue.get_nowait()
+                    # Com POSE_EVERY_N_FRAMES > 1, nao perde a inferencia mais
+                    # recente: o loop principal a reaproveita no lugar da antiga
+                    if dropped.inferred and not item.inferred and item.ok:
+                        item.detections = dropped.detections
+                        item.inferred = True
+                except queue.Empty:
+                    # O loop principal consumiu entre o put e o get; tenta de novo
+                    pass
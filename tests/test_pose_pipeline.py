@@ -0,0 +1,110 @@
+"""
+Testes do PosePipeline com camera e modelo falsos.
+
+Executar na raiz do projeto: python -m unittest tests.test_pose_pipeline
+"""
+
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from modules.pose_pipeline import FramePacer, PipelineFrame, PoseDetections, PosePipeline
+
+
+class FakeCamera:
+    """Camera que devolve frames pretos numerados (ou levanta erro)."""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.reads = 0
+
+    def read(self):
+        if self.error is not None:
+            raise self.error
+        self.reads += 1
+        return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+
+class FakeResult:
+    """Results sem keypoints (ninguem no quadro)."""
+    keypoints = None
+    boxes = None
+
+
+class FakePoseModel:
+    """Modelo de pose que devolve um Results vazio por chamada."""
+
+    def predict(self, frame, **kwargs):
+        return iter([FakeResult()])
+
+
+def _make_pipeline(camera) -> PosePipeline:
+    pipeline = PosePipeline(camera, FakePoseModel(), preprocess=lambda frame: frame)
+    # Cadencia curta para o teste nao depender de TARGET_FPS
+    pipeline._pacer = FramePacer(period=0.005)
+    return pipeline
+
+
+class PosePipelineTest(unittest.TestCase):
+
+    def test_drops_oldest_when_consumer_is_slow(self):
+        camera = FakeCamera()
+        pipeline = _make_pipeline(camera)
+        pipeline.start()
+        try:
+            # Consumidor "lento": deixa o trabalhador produzir varios frames
+            time.sleep(0.2)
+            first = pipeline.get(timeout=1.0)
+            second = pipeline.get(timeout=1.0)
+        finally:
+            pipeline.stop()
+
+        self.assertTrue(first.ok)
+        # Trabalhador nao bloqueou: o frame entregue e recente, nao o primeiro
+        self.assertGreater(camera.reads, 5)
+        self.assertGreater(first.frame_idx, 0)
+        self.assertGreater(second.frame_idx, first.frame_idx)
+
+    def test_dropped_inference_is_carried_over(self):
+        pipeline = _make_pipeline(FakeCamera())
+        detections = PoseDetections(
+            keypoints=np.zeros((1, 17, 2), dtype=np.float32), confidences=None, boxes=None
+        )
+        pipeline._put_latest(PipelineFrame(ok=True, detections=detections, inferred=True, frame_idx=0))
+        pipeline._put_latest(PipelineFrame(ok=True, inferred=False, frame_idx=1))
+
+        item = pipeline.get(timeout=0.1)
+        self.assertEqual(item.frame_idx, 1)
+        self.assertTrue(item.inferred)
+        self.assertIs(item.detections, detections)
+
+    def test_worker_exception_reaches_consumer(self):
+        error = RuntimeError("camera falhou")
+        pipeline = _make_pipeline(FakeCamera(error=error))
+        pipeline.start()
+        try:
+            item = pipeline.get(timeout=1.0)
+        finally:
+            pipeline.stop()
+
+        self.assertFalse(item.ok)
+        self.assertIs(item.error, error)
+
+    def test_stop_joins_worker(self):
+        pipeline = _make_pipeline(FakeCamera())
+        pipeline.start()
+        worker = pipeline._thread
+        pipeline.get(timeout=1.0)
+
+        pipeline.stop()
+
+        self.assertIsNone(pipeline._thread)
+        self.assertFalse(worker.is_alive())
+        self.assertTrue(pipeline._queue.empty())
+        self.assertNotIn(worker, threading.enumerate())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,7 @@ def get_system_settings() -> dict:
         "DEV_MODE": False,
         "DEV_SKIP_BED_DETECTION": False,
         "FLIP_HORIZONTAL": True,
+        "BED_FREEZE_AFTER_CALIBRATION": True,
         "BED_RECHECK_INTERVAL_HOURS": 6,
         "POSE_FRAMES_TO_CONFIRM": 10,
         "EMA_ALPHA": 0.3,
@@ -67,7 +68,7 @@ def get_system_settings() -> dict:
             content = f.read()
 
         # Parse boolean settings
-        for key in ["DEV_MODE", "DEV_SKIP_BED_DETECTION", "FLIP_HORIZONTAL"]:
+        for key in ["DEV_MODE", "DEV_SKIP_BED_DETECTION", "FLIP_HORIZONTAL", "BED_FREEZE_AFTER_CALIBRATION"]:
             match = re.search(rf'^{key}\s*=\s*(True|False)', content, re.MULTILINE)
             if match:
                 settings[key] = match.group(1) == "True"
@@ -103,7 +104,7 @@ def save_system_settings(settings: dict) -> tuple[bool, str]:
             content = f.read()
 
         # Update boolean settings
-        for key in ["DEV_MODE", "DEV_SKIP_BED_DETECTION", "FLIP_HORIZONTAL"]:
+        for key in ["DEV_MODE", "DEV_SKIP_BED_DETECTION", "FLIP_HORIZONTAL", "BED_FREEZE_AFTER_CALIBRATION"]:
             if key in settings:
                 value = "True" if settings[key] else "False"
                 content = re.sub(
@@ -82,6 +82,7 @@ class SystemSettings(BaseModel):
     DEV_MODE: Optional[bool] = None
     DEV_SKIP_BED_DETECTION: Optional[bool] = None
     FLIP_HORIZONTAL: Optional[bool] = None
+    BED_FREEZE_AFTER_CALIBRATION: Optional[bool] = None
     BED_RECHECK_INTERVAL_HOURS: Optional[int] = None
     POSE_FRAMES_TO_CONFIRM: Optional[int] = None
     EMA_ALPHA: Optional[float] = None
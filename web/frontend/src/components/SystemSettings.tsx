@@ -162,6 +162,19 @@ export function SystemSettings({ onBack }: SystemSettingsProps) {
                     onCheckedChange={(checked) => handleBoolChange('FLIP_HORIZONTAL', checked)}
                   />
                 </div>
+
+                <div className="flex items-center justify-between">
+                  <div className="space-y-0.5">
+                    <Label>Congelar Leito Apos Calibracao</Label>
+                    <p className="text-xs text-muted-foreground">
+                      Desliga a re-verificacao periodica do leito
+                    </p>
+                  </div>
+                  <Switch
+                    checked={settings.BED_FREEZE_AFTER_CALIBRATION}
+                    onCheckedChange={(checked) => handleBoolChange('BED_FREEZE_AFTER_CALIBRATION', checked)}
+                  />
+                </div>
               </div>
 
               {/* Numeric Settings */}
@@ -177,6 +190,7 @@ export function SystemSettings({ onBack }: SystemSettingsProps) {
                       id="bed_recheck"
                       type="number"
                       min="1"
+                      disabled={settings.BED_FREEZE_AFTER_CALIBRATION}
                       value={settings.BED_RECHECK_INTERVAL_HOURS}
                       onChange={(e) => handleNumberChange('BED_RECHECK_INTERVAL_HOURS', e.target.value)}
                     />
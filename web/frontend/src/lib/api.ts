@@ -15,6 +15,7 @@ export interface SystemSettings {
   DEV_MODE: boolean;
   DEV_SKIP_BED_DETECTION: boolean;
   FLIP_HORIZONTAL: boolean;
+  BED_FREEZE_AFTER_CALIBRATION: boolean;
   BED_RECHECK_INTERVAL_HOURS: number;
   POSE_FRAMES_TO_CONFIRM: number;
   EMA_ALPHA: number;